@@ -0,0 +1,35 @@
+function [fid_re, fid_im, npts, sw_out, cf_mhz] = fida_run_batch(metabs, kind, varargin)
+% FIDA_RUN_BATCH  Run fida_run for several metabolites in one Octave call.
+%
+%   [fid_re, fid_im, npts, sw_out, cf_mhz] = fida_run_batch(metabs, kind, ...)
+%
+%   Every call into Octave carries a fixed cost (oct2py MAT-file round trip,
+%   or a full octave-cli start plus path setup for the Docker runtime), so the
+%   Python side groups metabolites and loops over them here instead. The
+%   trailing arguments are forwarded unchanged to fida_run.
+%
+%   Inputs
+%     metabs : cell array of metabolite names (a single char is accepted)
+%     kind   : char  dispatch key, see fida_run
+%
+%   Outputs
+%     fid_re, fid_im : MxN real / imag parts, one row per metabolite
+%     npts           : length of each FID
+%     sw_out         : spectral width [Hz]
+%     cf_mhz         : carrier frequency [MHz]
+
+    if ischar(metabs)
+        metabs = {metabs};
+    end
+    fid_re = [];
+    fid_im = [];
+    for k = 1:numel(metabs)
+        [re, im, npts, sw_out, cf_mhz] = fida_run(metabs{k}, kind, varargin{:});
+        if isempty(fid_re)
+            fid_re = zeros(numel(metabs), npts);
+            fid_im = zeros(numel(metabs), npts);
+        end
+        fid_re(k, :) = re(:).';
+        fid_im(k, :) = im(:).';
+    end
+end
@@ -13,6 +13,99 @@
 
 from __future__ import annotations
 
+import contextlib
+import os
+import weakref
+
+import numpy as np
+
+from basisremy.core.octave_manager import close_session, session_is_dead
+
+
+# Octave sessions shared by every backend of this process, keyed on (pid, runtime) of the
+# runtime actually obtained ('docker' / 'local'). Starting Octave (or attaching to the Docker
+# container) is by far the slowest part of a first simulation, so switching backends or
+# re-running reuses the warm session. A session is dropped again as soon as a call through it
+# fails because the session itself is gone (see Backend.octave_session_guard).
+_OCTAVE_SESSIONS = {}
+
+
+# Sessions dropped after a failed call. Backends still holding one re-attach on their next
+# run (see Backend.ensure_octave) instead of reusing the dead handle.
+_DISCARDED_SESSIONS = weakref.WeakSet()
+
+
+# Path setup last applied to each Octave session (session -> tag). A backend re-running on the
+# session it set up last skips its addpath calls; switching backends resets the path and
+# re-applies them, so only the active backend's toolboxes and adapters are on the path.
+_SESSION_PATHS = weakref.WeakKeyDictionary()
+
+
+# Octave path of each session before any backend set it up (session -> path state), restored
+# whenever another backend takes the session over.
+_BASE_PATHS = weakref.WeakKeyDictionary()
+
+
+def _octave_path_state(octave):
+    """Return the current Octave path of ``octave`` in a form _restore_octave_path accepts."""
+    if hasattr(octave, 'persistent_commands'):
+        # Docker runtime: the path is rebuilt from the persistent commands on every call
+        return list(octave.persistent_commands)
+    return octave.feval('path')
+
+
+def _restore_octave_path(octave, state):
+    """Reset the Octave path of ``octave`` to ``state``."""
+    if hasattr(octave, 'persistent_commands'):
+        octave.persistent_commands[:] = state
+    else:
+        octave.feval('path', state, nout=0)
+
+
+def ensure_octave_paths(octave, tag, setup):
+    """Run ``setup(octave)`` unless ``tag`` is the path setup already active on ``octave``.
+
+    A session set up by another backend first has its path reset to the one it started with,
+    so toolboxes of different backends (e.g. two FID-A copies) never shadow each other.
+    """
+    if _SESSION_PATHS.get(octave) == tag:
+        return
+    if octave in _BASE_PATHS:
+        _SESSION_PATHS.pop(octave, None)
+        _restore_octave_path(octave, _BASE_PATHS[octave])
+    else:
+        _BASE_PATHS[octave] = _octave_path_state(octave)
+    setup(octave)
+    _SESSION_PATHS[octave] = tag
+
+
+def discard_octave_session(octave):
+    """Drop ``octave`` from the shared session cache and close it (if it still responds)."""
+    for key in [key for key, session in _OCTAVE_SESSIONS.items() if session is octave]:
+        del _OCTAVE_SESSIONS[key]
+    _SESSION_PATHS.pop(octave, None)
+    _BASE_PATHS.pop(octave, None)
+    _DISCARDED_SESSIONS.add(octave)
+    close_session(octave)
+
+
+def octave_quote(path):
+    """Return ``path`` as a single-quoted Octave string literal."""
+    return "'" + str(path).replace("'", "''") + "'"
+
+
+def complex_fid(fid_re, fid_im):
+    """Assemble a complex FID from the real / imaginary parts returned by Octave.
+
+    Both halves are written straight into one complex buffer rather than via
+    ``re + 1j * im``, which allocates two full-size temporaries per metabolite.
+    """
+    fid_re = np.asarray(fid_re, dtype=np.float64)
+    fid = np.empty(fid_re.shape, dtype=np.complex128)
+    fid.real = fid_re
+    fid.imag = np.asarray(fid_im, dtype=np.float64).reshape(fid_re.shape)
+    return fid
+
 
 #**************************************************************************************************#
 #                                             Backend                                              #
@@ -42,6 +135,7 @@ class Backend:
         # Octave runtime management
         self.requires_octave = False  # Set to True in subclasses that need Octave
         self.octave = None  # Will be initialized when needed
+        self.octave_runtime = None  # 'docker' or 'local' once initialized
 
         # define possible metabolites
         self.metabs = {}
@@ -145,6 +239,12 @@ class Backend:
         """
         Initialize Octave runtime if required by this backend.
 
+        The session is shared per process: once a backend has started Octave,
+        every other backend (and later calls) attach to the same instance. A
+        cached runtime is picked in the same preference order the fallback
+        uses, so a Docker request that fell back to local Octave reuses the
+        local session.
+
         Args:
             prefer_docker: If True, try Docker first, otherwise try local first
             verbose: Enable verbose output for debugging
@@ -158,11 +258,18 @@ class Backend:
         if not self.requires_octave:
             return True
 
+        for runtime in (('docker', 'local') if prefer_docker else ('local', 'docker')):
+            octave = _OCTAVE_SESSIONS.get((os.getpid(), runtime))
+            if octave is not None:
+                self.octave, self.octave_runtime = octave, runtime
+                return True
+
         from basisremy.core.octave_manager import OctaveManager
         manager = OctaveManager(verbose=verbose)
 
         try:
             self.octave = manager.initialize_octave(prefer_docker=prefer_docker)
+            self.octave_runtime = manager.runtime_type
 
             # If using Docker, check for and clean up old processes
             if hasattr(self.octave, 'check_running_processes'):
@@ -173,10 +280,34 @@ class Backend:
                     self.octave.kill_running_processes()
                     print(f"✓ Ready for new simulation")
 
+            _OCTAVE_SESSIONS[(os.getpid(), self.octave_runtime)] = self.octave
             return True
         except RuntimeError as e:
             raise RuntimeError(f"Failed to initialize Octave for {self.name} backend:\n{e}")
 
+    def ensure_octave(self, prefer_docker=True):
+        """Attach to the shared Octave session unless this backend holds a live one."""
+        if self.octave is None or self.octave in _DISCARDED_SESSIONS:
+            print("Initializing Octave runtime...")
+            self.initialize_octave(prefer_docker=prefer_docker)
+
+    @contextlib.contextmanager
+    def octave_session_guard(self):
+        """Discard this backend's session when a call through it fails because the session died.
+
+        Ordinary Octave errors (a failing script) leave the session in place. The error is
+        re-raised either way; after a discard the next ensure_octave() / initialize_octave()
+        starts a fresh session instead of reusing the dead one.
+        """
+        try:
+            yield
+        except Exception as e:
+            if self.octave is not None and session_is_dead(self.octave, e):
+                discard_octave_session(self.octave)
+                self.octave = None
+                self.octave_runtime = None
+            raise
+
     def update_from_backend(self, backend):
         # Update the backend parameters from another backend instance, transferring
         # only the values that make sense across backends (scan-physics params like
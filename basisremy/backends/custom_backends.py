@@ -21,7 +21,7 @@ import os
 import numpy as np
 
 # own
-from basisremy.backends.base import Backend
+from basisremy.backends.base import Backend, ensure_octave_paths, octave_quote
 
 
 #**************************************************************************************************#
@@ -33,6 +33,58 @@ from basisremy.backends.base import Backend
 #                                                                                                  #
 #**************************************************************************************************#
 class CustomSLaser(Backend):
+    # possible metabolites, the bool marks the ones enabled by default
+    _METABS_DEFAULT = {
+        'Ala': False,
+        'Asc': True,
+        'Asp': False,
+        'Bet': False,
+        'Ch': False,
+        'Cit': False,
+        'Cr': True,
+        'EtOH': False,
+        'GABA': True,
+        'GABA_gov': False,
+        'GABA_govind': False,
+        'GPC': True,
+        'GSH': True,
+        'GSH_v2': False,
+        'Glc': True,
+        'Gln': True,
+        'Glu': True,
+        'Gly': True,
+        'H2O': False,
+        'Ins': True,
+        'Lac': True,
+        'NAA': True,
+        'NAAG': True,
+        'PCh': True,
+        'PCr': True,
+        'PE': True,
+        'Phenyl': False,
+        'Ref0ppm': False,
+        'Scyllo': True,
+        'Ser': False,
+        'Tau': True,
+        'Tau_govind': False,
+        'Tyros': False,
+        'bHB': False,
+        'bHG': False,
+    }
+    # metabolites enabled by default, computed once for all instances
+    _DEFAULT_METABS = tuple(k for k, v in _METABS_DEFAULT.items() if v)
+
+    # fixed run parameters; the paths are relative to the project root, which is the
+    # working directory of both the local and the Docker Octave runtime
+    _FIXED_PARAMS = {
+        "Curfolder": "./externals/jbss/",
+        "Path to FIA-A": "./externals/fidA/",
+        "Path to Spin System": "./externals/jbss/my_mets/my_spinSystem.mat",
+        "Display": 'No',  # 0 (no display) <-> 1 (display)
+        "Make .raw": 'No',  # TODO: fix io_writelcmraw in sLASER_makebasisset_function
+        "Make .basis": 'Yes',
+    }
+
     def __init__(self):
         super().__init__()
         self.name = 'CustomSLaser'
@@ -45,43 +97,7 @@ class CustomSLaser(Backend):
 
 
         # define possible metabolites
-        self.metabs = {
-            'Ala': False,
-            'Asc': True,
-            'Asp': False,
-            'Bet': False,
-            'Ch': False,
-            'Cit': False,
-            'Cr': True,
-            'EtOH': False,
-            'GABA': True,
-            'GABA_gov': False,
-            'GABA_govind': False,
-            'GPC': True,
-            'GSH': True,
-            'GSH_v2': False,
-            'Glc': True,
-            'Gln': True,
-            'Glu': True,
-            'Gly': True,
-            'H2O': False,
-            'Ins': True,
-            'Lac': True,
-            'NAA': True,
-            'NAAG': True,
-            'PCh': True,
-            'PCr': True,
-            'PE': True,
-            'Phenyl': False,
-            'Ref0ppm': False,
-            'Scyllo': True,
-            'Ser': False,
-            'Tau': True,
-            'Tau_govind': False,
-            'Tyros': False,
-            'bHB': False,
-            'bHG': False,
-        }
+        self.metabs = dict(self._METABS_DEFAULT)
 
         # dropdown options (export-related options live in the Export dialog)
         self.dropdown = {
@@ -117,7 +133,7 @@ class CustomSLaser(Backend):
 
             "TE": None,
             "Center Freq": None,
-            "Metabolites": [key for key, value in self.metabs.items() if value],
+            "Metabolites": list(self._DEFAULT_METABS),
 
             "Tau 1": 15.,   # fake timing
             "Tau 2": 13.,
@@ -205,10 +221,11 @@ class CustomSLaser(Backend):
             return None
 
     def parse2fidA(self, params):
-        # convert parameters to fidA format if needed
-        params['Make .basis'] = params['Make .basis'][0].lower()
-        params['Make .raw'] = params['Make .raw'][0].lower()
-        params['Display'] = params['Display'][0].lower()
+        # convert parameters to fidA format if needed (returns a new dict, the
+        # input is left untouched so repeated calls give the same result)
+        params = dict(params)
+        for key in ('Make .basis', 'Make .raw', 'Display'):
+            params[key] = str(params[key])[:1].lower()
         return params
 
     def setup_octave_paths(self):
@@ -216,27 +233,38 @@ class CustomSLaser(Backend):
         if self.octave is None:
             raise RuntimeError("Octave not initialized. Call initialize_octave() first.")
 
+        ensure_octave_paths(self.octave, 'custom_slaser', self._add_octave_paths)
+
+    @staticmethod
+    def _add_octave_paths(octave):
         # Fetch FID-A and the sLASER (jbss) toolbox on first use
         # (no-op in a source checkout).
         from basisremy.core.externals import ensure
         from basisremy.core.paths import octave_adapters_base
         ensure('fidA')
         ensure('jbss')
-        self.octave.eval("warning('off', 'all');")
-        self.octave.addpath('./externals/fidA/inputOutput/')
-        self.octave.addpath('./externals/fidA/processingTools/')
-        self.octave.addpath('./externals/fidA/simulationTools/')
-        self.octave.addpath('./externals/jbss/')
-        self.octave.addpath(self.octave.genpath(octave_adapters_base(self.octave)))
+        # One addpath call, highest precedence first: adapters, jbss, then the
+        # FID-A simulation / processing / IO folders.
+        octave.eval(
+            "warning('off', 'all'); "
+            f"addpath(genpath({octave_quote(octave_adapters_base(octave))}), "
+            "'./externals/jbss/', "
+            "'./externals/fidA/simulationTools/', "
+            "'./externals/fidA/processingTools/', "
+            "'./externals/fidA/inputOutput/');"
+        )
 
     def run_simulation(self, params, progress_callback=None, stop_event=None):
+        # work on a copy: the caller's dict is usually self.mandatory_params,
+        # which must not pick up the run-only keys added below
+        params = dict(params)
+
         # Initialize Octave if not already done
-        if self.octave is None:
-            print("Initializing Octave runtime...")
-            self.initialize_octave(prefer_docker=True)
+        self.ensure_octave(prefer_docker=True)
 
         # Always setup paths (in case octave was initialized but paths weren't set)
-        self.setup_octave_paths()
+        with self.octave_session_guard():
+            self.setup_octave_paths()
 
         # Allocate an internal scratch directory for FID-A intermediate files
         workdir = self.ensure_workdir()
@@ -263,14 +291,7 @@ class CustomSLaser(Backend):
         params['Path to Pulse'] = pulse_path
 
         # fixed parameters
-        params.update({
-            "Curfolder": "./externals/jbss/",
-            "Path to FIA-A": "./externals/fidA/",
-            "Path to Spin System": "./externals/jbss/my_mets/my_spinSystem.mat",
-            "Display": 'No',  # 0 (no display) <-> 1 (display)
-            "Make .raw": 'No',  # TODO: fix io_writelcmraw in sLASER_makebasisset_function
-            "Make .basis": 'Yes',
-        })
+        params.update(self._FIXED_PARAMS)
         params = self.parse2fidA(params)   # convert parameters to fidA format if needed
 
         # define wrapper for octave function
@@ -309,7 +330,8 @@ class CustomSLaser(Backend):
             if stop_event and stop_event.is_set():
                 print("  ⏹  Simulation cancelled before Octave call.")
                 break
-            metab_list, outputs = sLASER_makebasisset_function(*task)
+            with self.octave_session_guard():
+                metab_list, outputs = sLASER_makebasisset_function(*task)
 
             # Debug: Show what we got from Octave
             if hasattr(self.octave, 'verbose') and self.octave.verbose:
@@ -24,11 +24,13 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import os
+import threading
 
-import numpy as np
-
-from basisremy.backends.base import Backend
+from basisremy.backends.base import Backend, complex_fid, ensure_octave_paths, octave_quote
+from basisremy.core.octave_pool import OctavePool, default_pool_size
 
 
 # --------------------------------------------------------------------------- defaults
@@ -44,6 +46,21 @@ _DEFAULT_FIDA_METABS = {
 }
 
 
+# One worker pool for the whole FID-A family. All FID-A backends share the same path
+# setup, so every backend and every run reuses the same warm Octave sessions; the pool
+# is created on the first parallel run and closed at interpreter exit.
+_FIDA_POOL = None
+_FIDA_POOL_LOCK = threading.Lock()
+
+
+def _get_fida_pool() -> OctavePool:
+    global _FIDA_POOL
+    with _FIDA_POOL_LOCK:
+        if _FIDA_POOL is None:
+            _FIDA_POOL = OctavePool(setup=FidaBackend._add_octave_paths)
+        return _FIDA_POOL
+
+
 def _shaped_params(extra: dict | None = None) -> dict:
     """Common parameter sheet for shaped 2-D-localised FID-A sims."""
     base = {
@@ -78,8 +95,11 @@ class FidaBackend(Backend):
       * ``self._kind``: string passed to ``fida_run.m`` to pick the simulator
       * ``self.mandatory_params`` (and optionally ``self.dropdown`` /
         ``self.file_selection`` / ``self.modes``)
-      * ``self._build_args(params, metab)``: positional args for ``fida_run``
-        AFTER the metabolite name and the ``kind`` argument
+      * ``self._build_args(params)``: positional args for ``fida_run``
+        AFTER the metabolite name and the ``kind`` argument (built once per
+        run and shared by every metabolite)
+      * optionally ``_required_params``: keys that must be filled in before
+        a run is started
 
     A subclass with ``self._kind == ''`` is considered a stub — the GUI shows
     it, but ``run_simulation`` raises NotImplementedError until the matching
@@ -88,6 +108,10 @@ class FidaBackend(Backend):
 
     _kind: str = ''      # dispatch key for fida_run.m
     _is_stub: bool = False
+    # metabolites per Octave call on the sequential, unmonitored path, i.e. headless
+    # BasisREMY.run(); the GUI always monitors its runs and simulates one at a time
+    _batch_size: int = 4
+    _required_params: tuple = ('Samples', 'Bandwidth', 'Bfield')
 
     def __init__(self):
         super().__init__()
@@ -129,26 +153,45 @@ class FidaBackend(Backend):
     def setup_octave_paths(self):
         if self.octave is None:
             raise RuntimeError("Octave not initialized.")
+        # all FID-A backends share one path setup
+        ensure_octave_paths(self.octave, 'fida', self._add_octave_paths)
+
+    @staticmethod
+    def _add_octave_paths(octave):
         # Fetch FID-A on first use (no-op in a source checkout).
         from basisremy.core.externals import ensure
         from basisremy.core.paths import octave_adapters_base
         ensure('fidA')
-        adapters_base = octave_adapters_base(self.octave)
-        self.octave.eval("warning('off', 'all');")
-        # First add the FID-A tree recursively so nested helpers (e.g.
-        # rfPulseTools/mklassenTools/bes.m, used by io_loadRFwaveform for
-        # phase-modulated waveforms like GOIA) are resolvable. Without this,
-        # shaped-pulse sims fail with "error: 'bes' undefined".
-        self.octave.eval("addpath(genpath('./externals/fidA/'));")
-        # THEN add our adapter dirs — addpath() prepends, so these now win
-        # over the upstream FID-A files. We use this to:
+        adapters_base = octave_adapters_base(octave)
+        # Issued as a single eval (one round trip). The FID-A tree is added
+        # recursively first so nested helpers (e.g. rfPulseTools/mklassenTools/
+        # bes.m, used by io_loadRFwaveform for phase-modulated waveforms like
+        # GOIA) are resolvable. Without this, shaped-pulse sims fail with
+        # "error: 'bes' undefined".
+        # THEN our adapter dirs — addpath() prepends, so these now win over
+        # the upstream FID-A files (within one addpath call the first dir ends
+        # up first). We use this to:
         #   * ship a patched sim_lcmrawbasis.m
         #   * ship a non-interactive io_loadRFwaveform.m (the upstream one
         #     calls plot()/input() for phase-modulated pulses, which fails
         #     in headless Docker Octave with "ft_text_renderer: invalid
         #     bounding box, cannot render, unable to create graphics handle").
-        self.octave.addpath(adapters_base + '/backends/')
-        self.octave.addpath(adapters_base + '/backends/fida/')
+        octave.eval(
+            "warning('off', 'all'); "
+            "addpath(genpath('./externals/fidA/')); "
+            f"addpath({octave_quote(adapters_base + '/backends/fida/')}, "
+            f"{octave_quote(adapters_base + '/backends/')});"
+        )
+
+    def _parallel_pool(self, n_tasks):
+        """Return the worker pool when the run should be fanned out, else None.
+
+        Only the local (Oct2Py) runtime is parallelised: the Docker runtime
+        shares one script / result file per container and is not re-entrant.
+        """
+        if self.octave_runtime != 'local' or n_tasks < 2 or default_pool_size() < 2:
+            return None
+        return _get_fida_pool()
 
     # -------------------------------------------------- REMY
     def parseREMY(self, MRSinMRS):
@@ -175,10 +218,16 @@ class FidaBackend(Backend):
         return protocol
 
     # -------------------------------------------------- per-subclass hook
-    def _build_args(self, params, metab):
+    def _build_args(self, params):
         """Positional args (AFTER metab + kind) for ``fida_run.m``."""
         raise NotImplementedError
 
+    def _check_params(self, params):
+        missing = [k for k in self._required_params if params.get(k) in (None, '')]
+        if missing:
+            raise ValueError(
+                f"{self.name}: please fill in {', '.join(missing)} before simulating.")
+
     # -------------------------------------------------- driver
     def run_simulation(self, params, progress_callback=None, stop_event=None):
         if self._is_stub or not self._kind:
@@ -190,37 +239,78 @@ class FidaBackend(Backend):
                 "canonical reference."
             )
 
-        if self.octave is None:
-            print("Initializing Octave runtime...")
-            self.initialize_octave(prefer_docker=True)
-        self.setup_octave_paths()
+        # Validate and convert the parameters once, before any Octave start-up,
+        # so bad input fails fast; every metabolite shares the same args.
+        self._check_params(params)
+        extra_args = self._build_args(params)
+
         self.ensure_workdir()
 
         metabs = params.get('Metabolites') or []
+        if stop_event and stop_event.is_set():
+            return {}
+
+        # The runtime decides whether the run is fanned out, so a backend that has
+        # not run yet attaches to the shared session first. Beyond that the pooled
+        # path leaves self.octave alone (pool sessions are set up by the pool).
+        if self.octave_runtime is None:
+            self.ensure_octave(prefer_docker=True)
+        pool = self._parallel_pool(len(metabs))
+        if pool is None:
+            self.ensure_octave(prefer_docker=True)
+            with self.octave_session_guard():
+                self.setup_octave_paths()
+        # One Octave call per batch: single metabolites when they are spread
+        # over the pool or when progress / stop requests are handled (so both
+        # stay per metabolite), small groups otherwise to amortise the per-call
+        # cost. The GUI passes both a progress callback and a stop event, so only
+        # headless runs (BasisREMY.run) are batched; GUI runs on the local runtime
+        # are sped up by the pool instead.
+        per_metab = pool is not None or progress_callback is not None or stop_event is not None
+        size = 1 if per_metab else self._batch_size
+        batches = (metabs[i:i + size] for i in range(0, len(metabs), size))
+        # the shared args are bound once; tasks only carry metabolite names
+        simulate = functools.partial(self._simulate_batch, extra_args=extra_args)
+        if pool is not None:
+            results = pool.imap_unordered(simulate, batches)
+        else:
+            results = (simulate(self.octave, batch) for batch in batches)
+
         basis = {}
-        for i, metab in enumerate(metabs):
-            if stop_event and stop_event.is_set():
-                print(f"  ⏹  Stopped before simulating {metab}.")
-                break
-            extra_args = self._build_args(params, metab)
-            results = self.octave.feval(
-                'fida_run', metab, self._kind, *extra_args, nout=5,
-            )
-            fid_re, fid_im, _npts, _sw, _cf = results
-            fid = (np.asarray(fid_re, dtype=float).flatten()
-                   + 1j * np.asarray(fid_im, dtype=float).flatten())
-            # FID-A's sim_readout stores `out.specs = fftshift(ifft(out.fids))`
-            # with a ppm axis `ppm = -freq/larmor + 4.65`.  fida_run.m returns
-            # out.fids directly (no conjugation applied), so the FID oscillates
-            # at -(δ - centreFreq)*larmor Hz for a metabolite at δ ppm.  Our
-            # GUI computes `fftshift(fft(fid))` and uses a ppm axis
-            # `+freq/larmor + 4.65`.  fft of a −f0 signal peaks at −f0 →
-            # maps to (−f0/larmor + 4.65) ppm — which correctly equals δ ppm
-            # when centreFreq = 4.65.  No conjugation needed here.
-            basis[metab] = fid
-            if progress_callback:
-                progress_callback(i + 1, len(metabs))
-        return basis
+        done = 0
+        # pool tasks run on the pool's own sessions, only guard self.octave
+        guard = self.octave_session_guard() if pool is None else contextlib.nullcontext()
+        try:
+            with guard:
+                for batch in results:
+                    basis.update(batch)
+                    done += len(batch)
+                    if progress_callback:
+                        progress_callback(done, len(metabs))
+                    if stop_event and stop_event.is_set() and done < len(metabs):
+                        print(f"  ⏹  Stopped after {done}/{len(metabs)} metabolites.")
+                        break
+        finally:
+            results.close()
+        # results may arrive out of order, report them in the requested order
+        return {metab: basis[metab] for metab in metabs if metab in basis}
+
+    def _simulate_batch(self, octave, batch, extra_args):
+        results = octave.feval(
+            'fida_run_batch', list(batch), self._kind, *extra_args, nout=5,
+        )
+        fid_re, fid_im, _npts, _sw, _cf = results
+        # one row per metabolite (a single row may come back squeezed to 1-D)
+        fids = complex_fid(fid_re, fid_im).reshape(len(batch), -1)
+        # FID-A's sim_readout stores `out.specs = fftshift(ifft(out.fids))`
+        # with a ppm axis `ppm = -freq/larmor + 4.65`.  fida_run.m returns
+        # out.fids directly (no conjugation applied), so the FID oscillates
+        # at -(δ - centreFreq)*larmor Hz for a metabolite at δ ppm.  Our
+        # GUI computes `fftshift(fft(fid))` and uses a ppm axis
+        # `+freq/larmor + 4.65`.  fft of a −f0 signal peaks at −f0 →
+        # maps to (−f0/larmor + 4.65) ppm — which correctly equals δ ppm
+        # when centreFreq = 4.65.  No conjugation needed here.
+        return dict(zip(batch, fids))
 
 
 # =================================================================== Ideal (ex-LCModel)
@@ -233,6 +323,7 @@ class FidaIdeal(FidaBackend):
     """
 
     _kind = 'ideal'
+    _required_params = ('Sequence', 'Samples', 'Bandwidth', 'Bfield', 'TE')
 
     def __init__(self):
         super().__init__()
@@ -321,7 +412,7 @@ class FidaIdeal(FidaBackend):
             )
         return mapped
 
-    def _build_args(self, params, metab):
+    def _build_args(self, params):
         # workdir for the FID-A-side .RAW writes (kept for parity with the
         # original sim_lcmrawbasis flow; the adapter ignores it but it
         # keeps the path structure consistent across runs).
@@ -361,7 +452,7 @@ class FidaPressShaped(FidaBackend):
             return None
         return 'PRESS' if 'press' in str(protocol).lower() else None
 
-    def _build_args(self, params, metab):
+    def _build_args(self, params):
         te   = params.get('TE')
         te   = float(te) if te is not None else None
         tau1 = params.get('Tau 1')
@@ -33,7 +33,7 @@ import os
 import numpy as np
 
 # own
-from basisremy.backends.base import Backend
+from basisremy.backends.base import Backend, complex_fid, ensure_octave_paths, octave_quote
 
 
 #**************************************************************************************************#
@@ -63,6 +63,8 @@ class MRSCloudBackend(Backend):
         # Exogenous compounds
         'EtOH': False, 'MSM':  False,
     }
+    # Metabolites enabled by default, computed once for all instances.
+    _DEFAULT_METABS = tuple(k for k, v in _METABS_DEFAULT.items() if v)
 
     _SEQUENCES     = ['UnEdited', 'MEGA', 'HERMES', 'HERCULES']
     _LOCALIZATIONS = ['PRESS', 'sLASER', 'STEAM_7T']
@@ -187,7 +189,7 @@ class MRSCloudBackend(Backend):
             'Bandwidth':      None,
             'TE':             None,
             'Spatial Points': 41,          # 41 acceptable, 101 ideal (slow)
-            'Metabolites':    [k for k, v in self.metabs.items() if v],
+            'Metabolites':    list(self._DEFAULT_METABS),
         }
 
         # Editing-sequence-only parameters (added to mandatory_params on the
@@ -475,16 +477,23 @@ class MRSCloudBackend(Backend):
     def setup_octave_paths(self):
         if self.octave is None:
             raise RuntimeError("Octave not initialized. Call initialize_octave() first.")
+        ensure_octave_paths(self.octave, 'mrscloud', self._add_octave_paths)
+
+    @staticmethod
+    def _add_octave_paths(octave):
         # Fetch MRSCloud on first use (no-op in a source checkout).
         from basisremy.core.externals import ensure
         from basisremy.core.paths import octave_adapters_base
         ensure('mrscloud')
-        self.octave.eval("warning('off', 'all');")
-        # adapters/backends contains our mrscloud_run_metab.m wrapper
-        self.octave.addpath(octave_adapters_base(self.octave) + '/backends/')
-        # Pull in MRSCloud (functions + bundled FID-A) recursively
-        self.octave.addpath(self.octave.genpath('./externals/mrscloud/functions/'))
-        self.octave.addpath(self.octave.genpath('./externals/mrscloud/pulses_universal/'))
+        # One addpath call, highest precedence first: MRSCloud's universal
+        # pulses and functions (with its bundled FID-A), recursively, then
+        # adapters/backends, which holds our mrscloud_run_metab.m wrapper.
+        octave.eval(
+            "warning('off', 'all'); "
+            "addpath(genpath('./externals/mrscloud/pulses_universal/'), "
+            "genpath('./externals/mrscloud/functions/'), "
+            f"{octave_quote(octave_adapters_base(octave) + '/backends/')});"
+        )
 
     # ----------------------------------------------------- pulse-file shimming
     def _stage_user_pulse(self, workdir: str, vendor: str, sequence: str,
@@ -563,10 +572,9 @@ class MRSCloudBackend(Backend):
     def run_simulation(self, params, progress_callback=None, stop_event=None):
         """Run MRSCloud per-metabolite and return { metab : 1-D complex FID }."""
         # Lazy Octave init
-        if self.octave is None:
-            print("Initializing Octave runtime...")
-            self.initialize_octave(prefer_docker=True)
-        self.setup_octave_paths()
+        self.ensure_octave(prefer_docker=True)
+        with self.octave_session_guard():
+            self.setup_octave_paths()
 
         # Internal scratch (MRSCloud writes intermediate .mat files here)
         workdir = self.ensure_workdir()
@@ -623,16 +631,21 @@ class MRSCloudBackend(Backend):
             print(f"[MRSCloud] {i+1}/{total}  simulating {metab} "
                   f"({sequence}/{localization} on {vendor}, TE={te} ms, B0={field_str})")
             try:
-                fid_re, fid_im, npts, _sw, _cf = self.octave.feval(
-                    'mrscloud_run_metab',
-                    metab, vendor, sequence, localization,
-                    te, field_str, edit_target,
-                    edit_on, edit_off, edit_tp, float(spatial), save_dir,
-                    float(samples), float(bandwidth),
-                    nout=5,
-                )
-                fid = np.asarray(fid_re, dtype=np.float64).flatten() \
-                    + 1j * np.asarray(fid_im, dtype=np.float64).flatten()
+                if self.octave is None:
+                    # the session died on the previous metabolite; attach to a fresh one
+                    self.ensure_octave(prefer_docker=True)
+                    with self.octave_session_guard():
+                        self.setup_octave_paths()
+                with self.octave_session_guard():
+                    fid_re, fid_im, npts, _sw, _cf = self.octave.feval(
+                        'mrscloud_run_metab',
+                        metab, vendor, sequence, localization,
+                        te, field_str, edit_target,
+                        edit_on, edit_off, edit_tp, float(spatial), save_dir,
+                        float(samples), float(bandwidth),
+                        nout=5,
+                    )
+                fid = complex_fid(fid_re, fid_im).ravel()
                 if fid.size == 0:
                     raise RuntimeError("empty FID returned")
                 basis_set[metab] = fid
@@ -15,16 +15,18 @@
 #*************#
 #   imports   #
 #*************#
+import copy
 import json
 import numpy as np
 import pathlib
 
+from types import MappingProxyType
+
 # own
 from basisremy.backends.fslmrs_backend import FSLMRSBackend
 from basisremy.backends.mrscloud_backend import MRSCloudBackend
 from basisremy.backends.custom_backends import CustomSLaser
 from basisremy.backends.fida_backends import FIDA_BACKENDS
-from basisremy.remy.MRSinMRS import DataReaders, Table, setup_log, write_log
 
 
 #**************************************************************************************************#
@@ -39,14 +41,41 @@ class BasisREMY:
     # Display order for the top-level Category dropdown.
     CATEGORY_ORDER = ['MRSCloud', 'FID-A', 'FSL-MRS', 'Custom']
 
+    # REMY dispatch: file suffix -> (DataReaders method, vendor, dtype, log message).
+    # NIfTI has no DataReaders entry, it is read from the JSON sidecar by _read_nifti().
+    # Read-only and shared by all instances.
+    _READERS = MappingProxyType({
+        '.dat':    ('siemens_twix',  'Siemens', 'dat',    'Data Read: Siemens Twix uses pyMapVBVD '),
+        '.ima':    ('siemens_ima',   'Siemens', 'ima',    'Data Read: Siemens Dicom uses pydicom '),
+        '.rda':    ('siemens_rda',   'Siemens', 'rda',    'Data Read: Siemens RDA directly read with RMY '),
+        '.spar':   ('philips_spar',  'Philips', 'spar',   'Data Read: Philips SPAR uses spec2nii '),
+        '.7':      ('ge_7',          'GE',      '7',      'Data Read: GE Pfile uses spec2nii '),
+        'method':  ('bruker_method', 'Bruker',  'method', 'Data Read: Bruker Method uses spec2nii '),
+        '2dseq':   ('bruker_2dseq',  'Bruker',  '2dseq',  'Data Read: Bruker uses BrukerAPI ' +
+                                                          'developed by Tomáš Pšorn\n\t' +
+                                                          'github.com/isi-nmr/brukerapi-python'),
+        '.nii':    (None,            'NIfTI',   'nii',    'Data Read: NIfTI json side car'),
+        '.nii.gz': (None,            'NIfTI',   'json',   'Data Read: NIfTI json side car'),
+    })
+
+    # Formats whose reader opens only the selected file, so that file's stat is a
+    # complete cache key. NIfTI reads its JSON sidecar and 2dseq the scan folder.
+    _CACHED_FORMATS = frozenset({'.dat', '.ima', '.rda', '.spar', '.7', 'method'})
+
     def __init__(self, backend='MRSCloud'):
-        self.DRead = DataReaders()
-        self.Table = Table()
+        # REMY readers / table, created on first use (see the DRead / Table properties)
+        self._DRead = None
+        self._Table = None
 
         # Cache the last REMY-extracted MRSinMRS dict so that switching
         # backends can re-parse it with the new backend's parseREMY().
         self._last_mrsinmrs = None
 
+        # REMY results per file (_CACHED_FORMATS only), keyed on (path, method,
+        # size, mtime) so that re-selecting an unchanged file skips the readers.
+        # Entries are deep-copied in and out, callers may modify what they get.
+        self._remy_cache = {}
+
         # Build the flat backend registry. The FID-A category contains many
         # entries (FidaIdeal = ex-LCModel, plus PRESS shaped, MEGA-PRESS
         # shaped, …); the other categories currently have a single backend.
@@ -70,6 +99,21 @@ class BasisREMY:
 
         self.set_backend(backend)
 
+    @property
+    def DRead(self):
+        # REMY pulls in pandas and its reader stack; defer that until a file is read
+        if self._DRead is None:
+            from basisremy.remy.MRSinMRS import DataReaders
+            self._DRead = DataReaders()
+        return self._DRead
+
+    @property
+    def Table(self):
+        if self._Table is None:
+            from basisremy.remy.MRSinMRS import Table
+            self._Table = Table()
+        return self._Table
+
     @property
     def available_backends(self):
         return list(self.backends.keys())
@@ -190,72 +234,46 @@ class BasisREMY:
 
     def runREMY(self, import_fpath, method=None):
         # run REMY datareader on the selected file
-        if method is None: suf = pathlib.Path(import_fpath).suffix.lower()
+        path = pathlib.Path(import_fpath)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:   # the readers would otherwise return an all-empty table
+            raise FileNotFoundError(f'No such file: {import_fpath}') from None
+
+        name = path.name.lower()
+        if method is None: suf = pathlib.Path(name).suffix
         else: suf = method
 
         # check for bruker mehtod or 2dseq (no suffix)
         if suf == '':
-            if 'method' in pathlib.Path(import_fpath).name.lower():
+            if 'method' in name:
                 suf = 'method'
-            elif '2dseq' in pathlib.Path(import_fpath).name.lower():
+            elif '2dseq' in name:
                 suf = '2dseq'
 
         if suf == '.gz':  # check for .nii.gz
-            if pathlib.Path(import_fpath).name.lower().endswith('.nii.gz'):
+            if name.endswith('.nii.gz'):
                 suf = '.nii.gz'
 
-        log = None
-        if suf == '.dat':   # Siemens Twix file
-            write_log(log, 'Data Read: Siemens Twix uses pyMapVBVD ')  # log - pyMapVBVD
-            MRSinMRS, log = self.DRead.siemens_twix(import_fpath, log)
-            vendor_selection = 'Siemens'
-        elif suf == '.ima':  # Siemens Dicom file
-            write_log(log, 'Data Read: Siemens Dicom uses pydicom ')  # log - pyDicom
-            MRSinMRS, log = self.DRead.siemens_ima(import_fpath, log)
-            vendor_selection = 'Siemens'
-        elif suf == '.rda':  # Siemens RDA file
-            write_log(log, 'Data Read: Siemens RDA directly read with RMY ')  # log - pyDicom
-            MRSinMRS, log = self.DRead.siemens_rda(import_fpath,    log)
-            vendor_selection = 'Siemens'
-        elif suf == '.spar':  # Philips SPAR file
-            write_log(log, 'Data Read: Philips SPAR uses spec2nii ')  # log - spec2nii
-            MRSinMRS, log = self.DRead.philips_spar(import_fpath, log)
-            vendor_selection = 'Philips'
-        elif suf == '.7':  # GE Pfile
-            write_log(log, 'Data Read: GE Pfile uses spec2nii ')  # log - spec2nii
-            MRSinMRS, log = self.DRead.ge_7(import_fpath, log)
-            vendor_selection = 'GE'
-        elif suf == 'method':  # Bruker Method file
-            write_log(log, 'Data Read: Bruker Method uses spec2nii ')  # log - spec2nii
-            MRSinMRS, log = self.DRead.bruker_method(import_fpath, log)
-            vendor_selection = 'Bruker'
-        elif suf == '2dseq':  # Bruker 2dseq file
-            write_log(log, 'Data Read: Bruker uses BrukerAPI ' +  # log - BrukerAPI
-                      'developed by Tomáš Pšorn\n\t' +
-                      'github.com/isi-nmr/brukerapi-python')
-            MRSinMRS, log = self.DRead.bruker_2dseq(import_fpath, log)
-            vendor_selection = 'Bruker'
-        elif suf == '.nii' or suf == '.nii.gz':   # TODO: might want to adjust to be .nii.gz
-            write_log(log, 'Data Read: NIfTI json side car')  # log - NIfTI JSON side car
-            # MRSinMRS, log = self.DRead.nifti_json(import_fpath, log)   # TODO: fix for nifti
-            try:
-                with open(import_fpath.replace(suf, '.json'), 'r') as f:
-                    MRSinMRS = json.load(f)
-            except:
-                from nifti_mrs.nifti_mrs import NIFTI_MRS
-                MRSinMRS = NIFTI_MRS(import_fpath).hdr_ext
-
-            # homogenize keys to be strings
-            MRSinMRS = {str(k): str(v[0]) if isinstance(v, list) and len(v) == 1 else v for k, v in
-                        dict(MRSinMRS).items()}
-
-            vendor_selection = 'NIfTI'
-        else:
+        if suf not in self._READERS:
             raise ValueError(f'Unknown file format {suf}! Valid formats are:'
                              f' .dat, .ima, .rda, .spar, .7, bruker_method, bruker_2dseq, .nii, .nii.gz')
+        reader, vendor_selection, dtype_selection, message = self._READERS[suf]
+
+        cache_key = None
+        if suf in self._CACHED_FORMATS:
+            cache_key = (str(path.resolve()), method, stat.st_size, stat.st_mtime_ns)
+            if cache_key in self._remy_cache:
+                self._last_mrsinmrs = copy.deepcopy(self._remy_cache[cache_key])
+                return copy.deepcopy(self._remy_cache[cache_key])
 
-        dtype_selection = suf.replace('.', '')  # remove dot if present
-        if suf == '.nii.gz': dtype_selection = 'json'  # special case
+        from basisremy.remy.MRSinMRS import write_log
+        log = None
+        write_log(log, message)
+        if reader is None:
+            MRSinMRS = self._read_nifti(import_fpath, suf)
+        else:
+            MRSinMRS, log = getattr(self.DRead, reader)(import_fpath, log)
 
         # check for missing MRSinMRS Values that might have different names across versions
         try:
@@ -275,11 +293,26 @@ class BasisREMY:
         # extend with more info
         MRSinMRS_unif.update(self.extract_more(MRSinMRS, vendor_selection, dtype_selection))
 
-        # Cache for later backend switches
+        # Cache for later backend switches (and re-reads of the same file)
         self._last_mrsinmrs = MRSinMRS_unif
+        if cache_key is not None:
+            self._remy_cache[cache_key] = copy.deepcopy(MRSinMRS_unif)
 
         return MRSinMRS_unif
 
+    def _read_nifti(self, import_fpath, suf):
+        # MRSinMRS, log = self.DRead.nifti_json(import_fpath, log)   # TODO: fix for nifti
+        try:
+            with open(import_fpath.replace(suf, '.json'), 'r') as f:
+                MRSinMRS = json.load(f)
+        except:
+            from nifti_mrs.nifti_mrs import NIFTI_MRS
+            MRSinMRS = NIFTI_MRS(import_fpath).hdr_ext
+
+        # homogenize keys to be strings
+        return {str(k): str(v[0]) if isinstance(v, list) and len(v) == 1 else v for k, v in
+                dict(MRSinMRS).items()}
+
     def extract_more(self, MRSinMRS, vendor, dtype):
         # extract additional information from the raw MRSinMRS dict if possible
         add_info = {}
@@ -317,10 +350,9 @@ class BasisREMY:
     def flatten_mrsinmrs_table(self, df):
         flat_dict = {}
 
-        # iterate over all rows
-        for idx, row in df.iterrows():
-            key = str(row['Generic']).strip()  # lower-level key
-            val = row['Values']
+        # walk the two columns directly (df.iterrows() builds a Series per row)
+        for key, val in zip(df['Generic'], df['Values']):
+            key = str(key).strip()  # lower-level key
 
             # skip empty keys
             if key != '' and key != 'nan':
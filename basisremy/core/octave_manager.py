@@ -19,6 +19,37 @@ import subprocess
 import shutil
 
 
+def session_is_dead(octave, error):
+    """Whether ``error``, raised by a call through ``octave``, means the session itself is gone.
+
+    Connection-level errors (OSError, which covers broken pipes and the docker / requests
+    connection errors, and EOFError) always do. Oct2Py raises Oct2PyError for every Octave
+    evaluation error as well, so in that case the session is probed with a trivial command.
+    Anything else (e.g. a failing script in the Docker runtime) leaves the session usable.
+    """
+    if isinstance(error, (OSError, EOFError)):
+        return True
+    try:
+        from oct2py import Oct2PyError
+    except ImportError:
+        return False
+    if not isinstance(error, Oct2PyError):
+        return False
+    try:
+        octave.eval('1;')
+    except Exception:
+        return True
+    return False
+
+
+def close_session(octave):
+    """Exit an Octave session, ignoring errors from one that is already gone."""
+    try:
+        octave.exit()
+    except Exception:
+        pass
+
+
 #**************************************************************************************************#
 #                                         OctaveManager                                            #
 #**************************************************************************************************#
@@ -0,0 +1,144 @@
+####################################################################################################
+#                                          octave_pool.py                                          #
+####################################################################################################
+#                                                                                                  #
+# Purpose: Persistent pool of local Octave sessions used to fan independent per-metabolite         #
+#          simulations out over several cores. Each worker thread owns one long-lived Oct2Py       #
+#          session (Oct2Py drives a separate octave process, so the threads do not contend on      #
+#          the GIL while Octave computes). Sessions are started lazily, set up once, and reused    #
+#          across runs until the pool is closed.                                                   #
+#                                                                                                  #
+####################################################################################################
+
+
+#*************#
+#   imports   #
+#*************#
+import atexit
+import itertools
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from basisremy.core.octave_manager import close_session, session_is_dead
+
+
+def default_pool_size():
+    """Number of Octave workers to use (``$BASISREMY_OCTAVE_WORKERS`` or the core count)."""
+    env = os.environ.get('BASISREMY_OCTAVE_WORKERS', '').strip()
+    if env:
+        try:
+            return max(1, int(env))
+        except ValueError:
+            pass
+    return max(1, os.cpu_count() or 1)
+
+
+def _local_octave():
+    from oct2py import Oct2Py
+    return Oct2Py()
+
+
+#**************************************************************************************************#
+#                                           OctavePool                                             #
+#**************************************************************************************************#
+#                                                                                                  #
+# Thread pool where every worker lazily creates (and keeps) its own Octave session.                #
+#                                                                                                  #
+#**************************************************************************************************#
+class OctavePool:
+    """
+    Persistent pool of Octave sessions.
+
+    Args:
+        size: Maximum number of worker threads / Octave sessions.
+        setup: Optional callable ``setup(octave)`` run once on every new session
+            (e.g. to add the adapter paths).
+        factory: Callable returning a new Octave session (defaults to a local
+            ``Oct2Py``). Mainly here so tests can inject fakes.
+    """
+
+    def __init__(self, size=None, setup=None, factory=None):
+        self.size = size or default_pool_size()
+        self._window = 2 * self.size   # tasks kept in flight (running + queued)
+        self._setup = setup
+        self._factory = factory or _local_octave
+        self._local = threading.local()
+        self._sessions = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=self.size,
+                                            thread_name_prefix='basisremy-octave')
+        self._closed = False
+        atexit.register(self.close)
+
+    def _session(self):
+        octave = getattr(self._local, 'octave', None)
+        if octave is None:
+            octave = self._factory()
+            if self._setup is not None:
+                try:
+                    self._setup(octave)
+                except BaseException:
+                    close_session(octave)
+                    raise
+            with self._lock:
+                self._sessions.append(octave)
+            self._local.octave = octave
+        return octave
+
+    def _drop_session(self, octave):
+        # forget a dead session, the worker's next task starts a new one
+        self._local.octave = None
+        with self._lock:
+            if octave in self._sessions:
+                self._sessions.remove(octave)
+        close_session(octave)
+
+    def _call(self, fn, item):
+        octave = self._session()
+        try:
+            return fn(octave, item)
+        except Exception as e:
+            if session_is_dead(octave, e):
+                self._drop_session(octave)
+            raise
+
+    def _submit(self, fn, items, n):
+        if self._closed:
+            raise RuntimeError("OctavePool is closed.")
+        return [self._executor.submit(self._call, fn, item)
+                for item in itertools.islice(items, n)]
+
+    def imap_unordered(self, fn, items):
+        """Yield ``fn(octave, item)`` for every item as soon as it finishes.
+
+        Results come back in completion order, so cheap tasks are not held
+        back behind expensive ones, which keeps progress reporting live while
+        the slow ones are still running. ``items`` may be any iterable (e.g. a
+        generator); it is consumed lazily, keeping only a couple of tasks per
+        worker in flight. Closing the generator early (e.g. on a user stop)
+        cancels whatever has not started yet.
+        """
+        items = iter(items)
+        pending = set(self._submit(fn, items, self._window))
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                pending.update(self._submit(fn, items, len(done)))
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def close(self):
+        """Stop the workers and shut down every Octave session."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for octave in sessions:
+            close_session(octave)
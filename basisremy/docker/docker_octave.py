@@ -231,6 +231,17 @@ class DockerOctave:
 
     def eval(self, cmd):
         """Execute an Octave command (persistent - stays for all feval calls)."""
+        self._persist(cmd)
+
+    def _persist(self, cmd):
+        """Record a persistent command, moving a repeated one to the end.
+
+        Backends re-issue their path setup when they become active again; keeping each
+        command once (in its latest position) gives the same Octave path as replaying every
+        call, without the generated script growing on every run.
+        """
+        if cmd in self.persistent_commands:
+            self.persistent_commands.remove(cmd)
         self.persistent_commands.append(cmd)
 
     def genpath(self, path):
@@ -249,11 +260,11 @@ class DockerOctave:
         if isinstance(path_or_genpath_result, str):
             if 'genpath(' in path_or_genpath_result:
                 # This is a genpath result, use it directly
-                self.persistent_commands.append(f"addpath({path_or_genpath_result});")
+                self._persist(f"addpath({path_or_genpath_result});")
             else:
                 # This is a regular path - normalize it
                 normalized_path = path_or_genpath_result.replace('\\', '/').lstrip('./')
-                self.persistent_commands.append(f"addpath('{normalized_path}');")
+                self._persist(f"addpath('{normalized_path}');")
 
     def set_verbose(self, verbose):
         """Enable or disable verbose output."""
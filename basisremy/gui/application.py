@@ -312,6 +312,7 @@ class BasisREMYApp:
         # selection / simulation state
         self.selected_file: str | None = None
         self.basis_set: dict | None = None
+        self._spectra: dict = {}
         self._basis_set_valid = False
 
         # simulation threading
@@ -904,7 +905,8 @@ class BasisREMYApp:
 
     # ============================================================== TAB 3
     def _build_tab3_progress(self) -> None:
-        self.panel3.clear()
+        # Built once: the progress box, the results view (figure included) and the
+        # error row persist across simulations and are only shown / hidden.
         with self.panel3:
             self.tab3_container = ui.column().classes("w-full items-center gap-6 py-2")
             with self.tab3_container:
@@ -922,10 +924,53 @@ class BasisREMYApp:
                         "text-sm text-grey-6"
                     )
                 self.results_container = ui.column().classes("w-full gap-4")
+                with self.results_container:
+                    self._build_results_view()
+                    with ui.row().classes("items-center gap-2") as self._error_row:
+                        ui.icon("error").classes("text-2xl").style("color:#c2453c")
+                        ui.label("Simulation failed — see the console for details.").classes(
+                            "text-sm font-semibold text-grey-9"
+                        )
             ui.element("div").classes("br-hairline")
             with ui.row().classes("w-full justify-start"):
                 ui.button("Back", icon="arrow_back",
                           on_click=lambda: self._goto("params")).props("flat color=primary")
+        self._reset_tab3()
+
+    def _build_results_view(self) -> None:
+        self.checkbox_vars = {}
+        self.metab_colors = {}
+        with ui.column().classes("w-full gap-4") as self._results_view:
+            with ui.row().classes("items-center gap-2 self-start"):
+                ui.icon("check_circle").classes("text-xl").style("color:#3f8f5b")
+                ui.label("Basis set ready").classes(
+                    "text-base font-bold text-grey-9"
+                )
+
+            with ui.row().classes("w-full no-wrap gap-6 items-start"):
+                # plot on the left
+                with ui.column().classes("grow min-w-0"):
+                    self.plot = ui.matplotlib(figsize=(7, 3)).classes("w-full")
+                    fig = self.plot.figure
+                    fig.patch.set_alpha(0.0)
+                    self.ax = fig.add_subplot(111)
+
+                # legend / metabolite toggles on the right, refilled per simulation
+                self._legend = ui.column().classes(
+                    "br-legend gap-0 max-h-72 overflow-auto pl-4"
+                )
+
+            ui.button("Export basis…", icon="download",
+                      on_click=self._open_export_dialog).props(
+                "color=primary unelevated"
+            )
+
+    def _reset_tab3(self) -> None:
+        self._progress_box.set_visibility(True)
+        self._results_view.set_visibility(False)
+        self._error_row.set_visibility(False)
+        self.progress.set_value(0)
+        self.progress_label.set_text("0%")
 
     def _simulate_basis(self) -> None:
         backend = self.BasisREMY.backend
@@ -936,8 +981,8 @@ class BasisREMYApp:
         # reset tab3 to a clean progress state
         self._basis_set_valid = False
         self.basis_set = None
-        self._build_tab3_progress()
-        self._progress_box.set_visibility(True)
+        self._spectra = {}
+        self._reset_tab3()
 
         self._unlock("sim")
         self._goto("sim")
@@ -951,8 +996,6 @@ class BasisREMYApp:
         self._sim_total = max(1, len(metabs))
         self._sim_done = False
         self._sim_error = None
-        self.progress.set_value(0)
-        self.progress_label.set_text("0%")
 
         self._sim_stop_event.clear()
         self._sim_thread = threading.Thread(target=self._run_simulation, daemon=True)
@@ -986,9 +1029,24 @@ class BasisREMYApp:
             self._sim_done = True
             return
 
+        # FFTs run here on the worker thread so the UI loop only has to draw
+        self._spectra = self._compute_spectra(basis)
         self.basis_set = basis
         self._sim_done = True
 
+    @staticmethod
+    def _compute_spectra(basis: dict) -> dict:
+        spectra = {}
+        for metab, data in basis.items():
+            try:
+                data = np.asarray(data, dtype=complex).flatten()
+            except Exception:  # noqa: BLE001
+                continue
+            if data.size == 0:
+                continue
+            spectra[metab] = np.real(np.fft.fftshift(np.fft.fft(data)))
+        return spectra
+
     def _poll_simulation(self) -> None:
         # live progress
         frac = self._sim_step / self._sim_total if self._sim_total else 0
@@ -1009,12 +1067,7 @@ class BasisREMYApp:
         if self._sim_error is not None:
             ui.notify(f"Simulation failed: {self._sim_error}", type="negative")
             self._progress_box.set_visibility(False)
-            with self.results_container:
-                with ui.row().classes("items-center gap-2"):
-                    ui.icon("error").classes("text-2xl").style("color:#c2453c")
-                    ui.label("Simulation failed — see the console for details.").classes(
-                        "text-sm font-semibold text-grey-9"
-                    )
+            self._error_row.set_visibility(True)
             print(f"Simulation error: {self._sim_error}")
             return
 
@@ -1030,42 +1083,22 @@ class BasisREMYApp:
         self.metab_colors = {}
         default_colors = plt.rcParams["axes.prop_cycle"].by_key()["color"]
 
-        with self.results_container:
-            with ui.row().classes("items-center gap-2 self-start"):
-                ui.icon("check_circle").classes("text-xl").style("color:#3f8f5b")
-                ui.label("Basis set ready").classes(
-                    "text-base font-bold text-grey-9"
-                )
-
-            with ui.row().classes("w-full no-wrap gap-6 items-start"):
-                # plot on the left
-                with ui.column().classes("grow min-w-0"):
-                    self.plot = ui.matplotlib(figsize=(7, 3)).classes("w-full")
-                    fig = self.plot.figure
-                    fig.patch.set_alpha(0.0)
-                    self.ax = fig.add_subplot(111)
-
-                # legend / metabolite toggles on the right
-                with ui.column().classes(
-                    "br-legend gap-0 max-h-72 overflow-auto pl-4"
-                ):
-                    for i, metab in enumerate(self.basis_set.keys()):
-                        color = default_colors[i % len(default_colors)]
-                        self.metab_colors[metab] = color
-                        with ui.row().classes("items-center gap-2 no-wrap"):
-                            ui.element("div").style(
-                                f"width:11px;height:11px;border-radius:3px;"
-                                f"background:{color};"
-                            )
-                            cb = ui.checkbox(metab, value=True).props("dense")
-                            cb.on_value_change(self._update_plot)
-                            self.checkbox_vars[metab] = cb
-
-            ui.button("Export basis…", icon="download",
-                      on_click=self._open_export_dialog).props(
-                "color=primary unelevated"
-            )
+        # only the legend is rebuilt, the figure is reused and redrawn in place
+        self._legend.clear()
+        with self._legend:
+            for i, metab in enumerate(self.basis_set.keys()):
+                color = default_colors[i % len(default_colors)]
+                self.metab_colors[metab] = color
+                with ui.row().classes("items-center gap-2 no-wrap"):
+                    ui.element("div").style(
+                        f"width:11px;height:11px;border-radius:3px;"
+                        f"background:{color};"
+                    )
+                    cb = ui.checkbox(metab, value=True).props("dense")
+                    cb.on_value_change(self._update_plot)
+                    self.checkbox_vars[metab] = cb
 
+        self._results_view.set_visibility(True)
         self._update_plot()
 
     def _open_export_dialog(self) -> None:
@@ -1099,20 +1132,10 @@ class BasisREMYApp:
         bw = float(mp["Bandwidth"])
 
         for metab, cb in self.checkbox_vars.items():
-            if cb.value and metab in self.basis_set:
-                data = self.basis_set[metab]
-                if not isinstance(data, np.ndarray):
-                    try:
-                        data = np.array(data, dtype=complex)
-                    except Exception:  # noqa: BLE001
-                        continue
-                if data.ndim > 1:
-                    data = data.flatten()
-                if data.size == 0:
-                    continue
+            ydata = self._spectra.get(metab)
+            if cb.value and ydata is not None:
                 try:
-                    ydata = np.real(np.fft.fftshift(np.fft.fft(data)))
-                    npts = data.size
+                    npts = ydata.size
                     ppm_axis = np.linspace(-bw / 2, bw / 2, npts) / cf * 1e6 + 4.65
                     self.ax.plot(ppm_axis, ydata, color=self.metab_colors[metab])
                 except Exception as e:  # noqa: BLE001
@@ -87,3 +87,25 @@ class TestSLaserSLASER:
         print(f"\n✅ SUCCESS!")
         print(f"   Output: test_slaser.basis ({file_size} bytes)")
         print(f"{'='*80}\n")
+
+
+@pytest.mark.backend
+@pytest.mark.slaser
+@pytest.mark.unit
+class TestSLaserParams:
+    """Test sLaser parameter conversion (no Octave required)"""
+
+    def test_parse2fida_is_pure(self):
+        """parse2fidA must not modify its input and must be repeatable"""
+        from basisremy.backends.custom_backends import CustomSLaser
+        params = {'Make .basis': 'Yes', 'Make .raw': 'No', 'Display': 'No', 'TE': 35}
+        backend = CustomSLaser()
+
+        first = backend.parse2fidA(params)
+        second = backend.parse2fidA(first)
+
+        assert params['Make .basis'] == 'Yes'
+        assert first == second
+        assert first['Make .basis'] == 'y'
+        assert first['Make .raw'] == 'n'
+        assert first['TE'] == 35
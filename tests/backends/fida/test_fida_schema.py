@@ -14,11 +14,14 @@ from __future__ import annotations
 
 import os
 import sys
+import threading
 
+import numpy as np
 import pytest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
 
+from basisremy.backends import fida_backends
 from basisremy.backends.fida_backends import (
     FIDA_BACKENDS,
     FidaBackend,
@@ -30,6 +33,7 @@ from basisremy.backends.fida_backends import (
     FidaLaser,
     FidaOnePulse,
 )
+from basisremy.core.octave_pool import OctavePool
 
 
 # ============================================================ taxonomy
@@ -96,7 +100,7 @@ class TestPressShaped:
             'TE': 30, 'Path to Pulse': None,
         })
         with pytest.raises(ValueError, match='Path to Pulse'):
-            b._build_args(b.mandatory_params, 'NAA')
+            b._build_args(b.mandatory_params)
 
     def test_build_args_returns_positional_list(self, tmp_path):
         b = FidaPressShaped()
@@ -105,7 +109,7 @@ class TestPressShaped:
             'Samples': 2048, 'Bandwidth': 4000, 'Bfield': 3.0,
             'Linewidth': 1.0, 'TE': 30, 'Path to Pulse': str(pulse),
         })
-        args = b._build_args(b.mandatory_params, 'NAA')
+        args = b._build_args(b.mandatory_params)
         # FidaBackend.run_simulation prepends (metab, kind); _build_args
         # returns just the trailing positional args. Length = 16 for press_shaped.
         assert len(args) == 16
@@ -113,6 +117,252 @@ class TestPressShaped:
         assert args[1] == 4000.0          # sw
         assert args[2] == 3.0             # Bfield
 
+    def test_missing_params_fail_before_octave(self):
+        b = FidaIdeal()
+        b.mandatory_params.update({'Sequence': 'PRESS', 'Bfield': 3.0, 'TE': 30})
+        with pytest.raises(ValueError, match='Samples, Bandwidth'):
+            b.run_simulation(b.mandatory_params)
+        assert b.octave is None
+
+
+# ============================================================ driver (fake Octave)
+_METABS = ['NAA', 'Cr', 'GABA', 'Glu', 'Gln', 'Ins', 'Lac']
+_NPTS = 8
+
+
+class FakeOctave:
+    """Stand-in session answering ``fida_run_batch`` like Octave would.
+
+    Row k of the result is filled with the metabolite's index in _METABS, so
+    every FID can be traced back to the metabolite it was simulated for. A
+    single metabolite comes back squeezed to 1-D, as Oct2Py returns it.
+    """
+
+    def __init__(self):
+        self.batches = []
+
+    def feval(self, name, metabs, kind, *args, nout=1):
+        assert name == 'fida_run_batch'
+        self.batches.append(list(metabs))
+        fid_re = np.array([[_METABS.index(m)] * _NPTS for m in metabs], dtype=float)
+        if len(metabs) == 1:
+            fid_re = fid_re[0]
+        return fid_re, -fid_re, _NPTS, 4000.0, 123.2
+
+    def exit(self):
+        pass
+
+
+@pytest.fixture
+def fake_ideal(tmp_path, monkeypatch):
+    """FidaIdeal wired to a FakeOctave on the sequential (non-pool) path"""
+    monkeypatch.setenv('BASISREMY_OCTAVE_WORKERS', '1')
+    b = FidaIdeal()
+    b.octave = FakeOctave()
+    b.octave_runtime = 'local'
+    monkeypatch.setattr(b, 'setup_octave_paths', lambda: None)
+    monkeypatch.setattr(b, 'ensure_workdir', lambda: str(tmp_path))
+    b.mandatory_params.update({'Sequence': 'PRESS', 'Samples': _NPTS, 'Bandwidth': 4000,
+                               'Bfield': 3.0, 'TE': 30, 'Metabolites': list(_METABS)})
+    return b
+
+
+def _assert_basis(basis, metabs):
+    assert list(basis) == list(metabs)
+    for metab, fid in basis.items():
+        assert fid.shape == (_NPTS,)
+        assert np.all(fid == _METABS.index(metab) * (1 - 1j))
+
+
+class TestSimulationDriver:
+    @pytest.mark.parametrize("batch_size", [1, 3])
+    def test_batches_map_back_to_requested_metabolites(self, fake_ideal, batch_size):
+        fake_ideal._batch_size = batch_size
+        basis = fake_ideal.run_simulation(fake_ideal.mandatory_params)
+
+        _assert_basis(basis, _METABS)
+        assert [len(b) for b in fake_ideal.octave.batches] == \
+            [len(_METABS[i:i + batch_size]) for i in range(0, len(_METABS), batch_size)]
+
+    def test_progress_is_reported_per_metabolite(self, fake_ideal):
+        progress = []
+        basis = fake_ideal.run_simulation(fake_ideal.mandatory_params,
+                                          progress_callback=lambda done, total: progress.append(done))
+
+        _assert_basis(basis, _METABS)
+        assert progress == list(range(1, len(_METABS) + 1))
+        assert all(len(b) == 1 for b in fake_ideal.octave.batches)
+
+    def test_stop_returns_partial_basis(self, fake_ideal):
+        stop = threading.Event()
+
+        def progress(done, total):
+            if done == 2:
+                stop.set()
+
+        basis = fake_ideal.run_simulation(fake_ideal.mandatory_params,
+                                          progress_callback=progress, stop_event=stop)
+
+        _assert_basis(basis, _METABS[:2])
+        assert len(fake_ideal.octave.batches) == 2
+
+
+class SlowNAAOctave(FakeOctave):
+    """FakeOctave whose NAA simulation blocks until ``release`` is set."""
+
+    release = threading.Event()
+
+    def feval(self, name, metabs, kind, *args, nout=1):
+        if 'NAA' in metabs:
+            self.release.wait(5)
+        return super().feval(name, metabs, kind, *args, nout=nout)
+
+
+class TestPoolDriver:
+    @pytest.fixture
+    def pooled_ideal(self, fake_ideal, monkeypatch):
+        """fake_ideal fanned out over a 3-worker pool of SlowNAAOctave sessions"""
+        monkeypatch.setenv('BASISREMY_OCTAVE_WORKERS', '3')
+        SlowNAAOctave.release = threading.Event()
+        pool = OctavePool(size=3, factory=SlowNAAOctave)
+        monkeypatch.setattr(fida_backends, '_FIDA_POOL', pool)
+        # the pooled path must not set up (or otherwise use) the backend's own session
+        monkeypatch.setattr(fake_ideal, 'setup_octave_paths',
+                            lambda: pytest.fail('paths set up on the unused session'))
+        yield fake_ideal
+        SlowNAAOctave.release.set()
+        pool.close()
+
+    def test_out_of_order_results_are_remapped(self, pooled_ideal):
+        progress = []
+
+        def on_progress(done, total):
+            progress.append(done)
+            if done == total - 1:   # everything but the slow NAA has finished
+                SlowNAAOctave.release.set()
+
+        basis = pooled_ideal.run_simulation(pooled_ideal.mandatory_params,
+                                            progress_callback=on_progress)
+
+        _assert_basis(basis, _METABS)
+        assert progress == list(range(1, len(_METABS) + 1))
+        assert pooled_ideal.octave.batches == []   # nothing ran on the backend's own session
+
+    def test_stop_cancels_pending_metabolites(self, pooled_ideal):
+        stop = threading.Event()
+        basis = pooled_ideal.run_simulation(pooled_ideal.mandatory_params,
+                                            progress_callback=lambda done, total: stop.set(),
+                                            stop_event=stop)
+
+        # the first finished metabolite (never the blocked NAA) is all that is returned
+        assert len(basis) == 1
+        assert 'NAA' not in basis
+        _assert_basis(basis, [m for m in _METABS if m in basis])
+
+
+class FakeManager:
+    """Stand-in OctaveManager: Docker is never available, falls back to local."""
+
+    started = []
+
+    def __init__(self, verbose=False):
+        self.runtime_type = None
+
+    def initialize_octave(self, prefer_docker=True):
+        self.runtime_type = 'local'
+        octave = FakeOctave()
+        FakeManager.started.append(octave)
+        return octave
+
+
+class TestSharedOctaveSession:
+    @pytest.fixture(autouse=True)
+    def fake_manager(self, monkeypatch):
+        from basisremy.backends import base
+        from basisremy.core import octave_manager
+        monkeypatch.setattr(base, '_OCTAVE_SESSIONS', {})
+        monkeypatch.setattr(octave_manager, 'OctaveManager', FakeManager)
+        FakeManager.started = []
+
+    def test_session_is_cached_under_the_runtime_obtained(self):
+        first, second = FidaIdeal(), FidaIdeal()
+        first.initialize_octave(prefer_docker=True)
+        second.initialize_octave(prefer_docker=False)
+
+        assert first.octave_runtime == second.octave_runtime == 'local'
+        assert second.octave is first.octave
+        assert len(FakeManager.started) == 1
+
+    def test_failed_session_is_discarded(self, fake_ideal):
+        def dead(*args, **kwargs):
+            raise OSError('octave process died')
+
+        fake_ideal.octave_runtime = None
+        fake_ideal.octave = None
+        fake_ideal.initialize_octave()
+        other = FidaIdeal()
+        other.initialize_octave()
+        fake_ideal.octave.feval = dead
+
+        with pytest.raises(OSError):
+            fake_ideal.run_simulation(fake_ideal.mandatory_params)
+        assert fake_ideal.octave is None
+
+        # the next run (of any backend holding the dead handle) starts afresh
+        fake_ideal.ensure_octave()
+        other.ensure_octave()
+        assert len(FakeManager.started) == 2
+        assert other.octave is fake_ideal.octave is FakeManager.started[-1]
+        _assert_basis(fake_ideal.run_simulation(fake_ideal.mandatory_params), _METABS)
+
+    @pytest.mark.parametrize("runtime", ['local', 'docker'])
+    def test_switching_backends_resets_the_path(self, runtime):
+        from basisremy.backends.base import ensure_octave_paths
+        octave = PathOctave() if runtime == 'local' else DockerPathOctave()
+
+        def adds(path):
+            return lambda session: session.eval(f"addpath('{path}');")
+
+        ensure_octave_paths(octave, 'fida', adds('fidA'))
+        ensure_octave_paths(octave, 'custom_slaser', adds('jbss'))
+        assert octave.dirs() == ['jbss', 'oct2py']
+        ensure_octave_paths(octave, 'fida', adds('fidA'))
+        assert octave.dirs() == ['fidA', 'oct2py']
+        ensure_octave_paths(octave, 'fida', adds('other'))
+        assert octave.dirs() == ['fidA', 'oct2py']
+
+
+class PathOctave:
+    """Stand-in Oct2Py session tracking its path (starts with Oct2Py's helper dir)."""
+
+    def __init__(self):
+        self.path = 'oct2py'
+
+    def eval(self, cmd):
+        self.path = cmd[len("addpath('"):-len("');")] + ':' + self.path
+
+    def feval(self, name, *args, nout=1):
+        assert name == 'path'
+        if args:
+            self.path = args[0]
+        return self.path
+
+    def dirs(self):
+        return self.path.split(':')
+
+
+class DockerPathOctave:
+    """Stand-in DockerOctave: the path is replayed from the persistent commands."""
+
+    def __init__(self):
+        self.persistent_commands = ["addpath('oct2py');"]
+
+    def eval(self, cmd):
+        self.persistent_commands.append(cmd)
+
+    def dirs(self):
+        return [cmd[len("addpath('"):-len("');")] for cmd in reversed(self.persistent_commands)]
+
 
 # ============================================================ stubs
 @pytest.mark.parametrize("cls", [
@@ -18,10 +18,12 @@ from __future__ import annotations
 import os
 import sys
 
+import numpy as np
 import pytest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
 
+from basisremy.backends import base
 from basisremy.backends.mrscloud_backend import MRSCloudBackend
 
 
@@ -159,6 +161,59 @@ class TestPulseFiles:
         assert missing == []
 
 
+# ============================================================ simulation errors
+class FailingMetabOctave:
+    """Stand-in session whose simulation fails (as a script error) for one metabolite."""
+
+    def __init__(self, failing):
+        from oct2py import Oct2PyError
+        self.error = Oct2PyError
+        self.failing = failing
+        self.simulated = []
+        self.exited = False
+
+    def eval(self, cmd):
+        pass
+
+    def feval(self, name, metab, *args, nout=5):
+        self.simulated.append(metab)
+        if metab == self.failing:
+            raise self.error(f"error: {metab} simulation failed")
+        return np.ones(8), np.zeros(8), 8, 2000.0, 123.2
+
+    def exit(self):
+        self.exited = True
+
+
+class TestSimulationErrors:
+
+    @pytest.fixture
+    def backend(self, tmp_path, monkeypatch):
+        pytest.importorskip('oct2py')
+        backend = MRSCloudBackend()
+        backend.octave = FailingMetabOctave('GABA')
+        backend.octave_runtime = 'local'
+        monkeypatch.setattr(backend, 'setup_octave_paths', lambda: None)
+        monkeypatch.setattr(backend, 'ensure_workdir', lambda: str(tmp_path))
+        monkeypatch.setattr(backend, '_stage_user_pulse', lambda *args: None)
+        monkeypatch.setattr(backend, '_stage_universal_excite_shim', lambda *args: None)
+        return backend
+
+    def test_script_error_skips_only_that_metabolite(self, backend):
+        octave = backend.octave
+        params = {'System': 'Philips', 'Sequence': 'UnEdited', 'Localization': 'PRESS',
+                  'Samples': 8, 'Metabolites': ['NAA', 'GABA', 'Cr']}
+        basis = backend.run_simulation(params)
+
+        assert octave.simulated == ['NAA', 'GABA', 'Cr']
+        assert not np.any(basis['GABA'])
+        assert np.all(basis['NAA'] == 1) and np.all(basis['Cr'] == 1)
+        # a script error leaves the live session attached and shared
+        assert backend.octave is octave
+        assert not octave.exited
+        assert octave not in base._DISCARDED_SESSIONS
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
 
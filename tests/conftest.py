@@ -2,33 +2,120 @@
 Pytest fixtures and configuration for BasisREMY tests
 """
 
+import functools
 import os
+import pathlib
+import shutil
+import socket
 import sys
 import pytest
 
+# Project paths, resolved once
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parent.parent
+EXAMPLE_DATA = PROJECT_ROOT / 'example_data'
+OUTPUT = PROJECT_ROOT / 'output'
+
 # Add project root to path
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-sys.path.insert(0, project_root)
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tests.utils.file_discovery import get_files_for_format
+from tests.utils.remy_sweep import REMY_RESULTS, merge_results, print_summary
+
+
+# Availability probes, memoized so the fixtures and the collection hook share one check per run
+_DOCKER_SOCKETS = (
+    '/var/run/docker.sock',
+    os.path.expanduser('~/.docker/run/docker.sock'),     # Docker Desktop (macOS)
+    os.path.expanduser('~/.orbstack/run/docker.sock'),   # OrbStack (macOS)
+)
+
+
+def _docker_socket_reachable(path, timeout=0.2):
+    """Check that something accepts connections on the unix socket ``path``"""
+    if not hasattr(socket, 'AF_UNIX') or not os.path.exists(path):
+        return False
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(path)
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_docker_client():
+    """Shared docker-py client for the session (None if docker-py or the daemon is missing)"""
+    try:
+        import docker
+    except ImportError:
+        return None
+    # short timeout: a wedged daemon (e.g. OrbStack dropping the connection) must not hang tests
+    try:
+        return docker.from_env(timeout=2)
+    except Exception:
+        pass
+    orbstack_socket = os.path.expanduser('~/.orbstack/run/docker.sock')
+    if os.path.exists(orbstack_socket):
+        try:
+            return docker.DockerClient(base_url=f'unix://{orbstack_socket}', timeout=2)
+        except Exception:
+            pass
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_docker():
+    """Check if Docker is reachable (supports both Docker Desktop and OrbStack on macOS)"""
+    host = os.environ.get('DOCKER_HOST', '')
+    if host and not host.startswith('unix://'):
+        # tcp:// or npipe:// daemon, ask it through docker-py
+        client = _get_docker_client()
+        try:
+            return client is not None and client.ping()
+        except Exception:
+            return False
+    candidates = (host[len('unix://'):],) if host else _DOCKER_SOCKETS
+    return any(_docker_socket_reachable(path) for path in candidates)
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_octave_binary():
+    """Check if an octave binary is on PATH"""
+    return (shutil.which('octave-cli') or shutil.which('octave')) is not None
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_octave():
+    """Check if local Octave is usable by BasisREMY (binary on PATH and oct2py importable)"""
+    if not _probe_octave_binary():
+        return False
+    try:
+        import oct2py  # noqa: F401
+        return True
+    except ImportError:
+        return False
 
 
 @pytest.fixture(scope="session")
 def project_root_dir():
     """Return the project root directory"""
-    return project_root
+    return str(PROJECT_ROOT)
 
 
 @pytest.fixture(scope="session")
-def example_data_dir(project_root_dir):
+def example_data_dir():
     """Return the example data directory"""
-    return os.path.join(project_root_dir, 'example_data')
+    return str(EXAMPLE_DATA)
 
 
 @pytest.fixture(scope="session")
-def output_dir(project_root_dir):
+def output_dir():
     """Return the output directory"""
-    output_path = os.path.join(project_root_dir, 'output')
-    os.makedirs(output_path, exist_ok=True)
-    return output_path
+    OUTPUT.mkdir(parents=True, exist_ok=True)
+    return str(OUTPUT)
 
 
 @pytest.fixture(scope="function")
@@ -42,22 +129,35 @@ def test_output_dir(output_dir, request):
 
 @pytest.fixture(scope="session")
 def docker_available():
-    """Check if Docker is available"""
-    try:
-        import docker
-        client = docker.from_env()
-        client.ping()
-        return True
-    except:
-        return False
+    """Check if Docker is available (read-only flag, safe to share for the session)"""
+    return _probe_docker()
 
 
 @pytest.fixture(scope="session")
 def octave_available():
-    """Check if local Octave is available"""
-    import shutil
-    octave_cmd = shutil.which('octave-cli') or shutil.which('octave')
-    return octave_cmd is not None
+    """Check if an octave binary is on PATH (read-only flag, safe to share for the session)
+
+    Unlike the requires_octave marker this does not require oct2py.
+    """
+    return _probe_octave_binary()
+
+
+@pytest.fixture(scope="session")
+def basisremy_cache():
+    """Return ``get_br(name)``: one shared BasisREMY per backend name for the session.
+
+    Building a BasisREMY instantiates every backend, so read-only tests share
+    instances instead of constructing a fresh one each time.
+    """
+    from basisremy.core.basisremy import BasisREMY
+    cache = {}
+
+    def get_br(name='MRSCloud'):
+        if name not in cache:
+            cache[name] = BasisREMY(backend=name)
+        return cache[name]
+
+    return get_br
 
 
 @pytest.fixture(scope="function")
@@ -72,66 +172,59 @@ def enable_verbose():
         os.environ.pop('BASISREMY_VERBOSE', None)
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="module")
 def cleanup_docker_processes():
-    """Cleanup Docker Octave processes after test"""
+    """Cleanup Docker Octave processes after the tests of a module
+
+    DockerOctave starts a fresh octave-cli per feval, so there is no long-lived
+    session to reset between tests; one pkill per module is enough to clear
+    anything left over, and it is skipped entirely without Docker.
+    """
     yield
+    client = _get_docker_client() if _probe_docker() else None
+    if client is None:
+        return
     try:
-        import docker
-        client = docker.from_env()
-        try:
-            container = client.containers.get('octave_runner')
-            container.exec_run("pkill -9 octave-cli")
-        except:
-            pass
+        container = client.containers.get('octave_runner')
+        container.exec_run("pkill -9 octave-cli")
     except:
         pass
 
 
 # Test data fixtures
 @pytest.fixture(scope="session")
-def philips_spar_file(example_data_dir):
+def philips_spar_file():
     """Philips SPAR test file"""
-    return os.path.join(example_data_dir, 'BigGABA_P1P_S01', 'S01_PRESS_35_act.SPAR')
+    return str(EXAMPLE_DATA / 'BigGABA_P1P_S01' / 'S01_PRESS_35_act.SPAR')
 
 
 @pytest.fixture(scope="session")
 def siemens_rda_file(example_data_dir):
     """Siemens RDA test file (if available)"""
     # Look for .rda files in example_data
-    for root, dirs, files in os.walk(example_data_dir):
-        for file in files:
-            if file.lower().endswith('.rda'):
-                return os.path.join(root, file)
-    return None
+    return next(iter(get_files_for_format('.rda', example_data_dir)), None)
 
 
 @pytest.fixture(scope="session")
 def ge_p_file(example_data_dir):
     """GE P-file test file"""
     ge_dir = os.path.join(example_data_dir, 'BigGABA_G1P_S01')
-    if os.path.exists(ge_dir):
-        for file in os.listdir(ge_dir):
-            if file.endswith('.7'):
-                return os.path.join(ge_dir, file)
-    return None
+    return next((f for f in get_files_for_format('.7', example_data_dir)
+                 if os.path.dirname(f) == ge_dir), None)
 
 
 @pytest.fixture(scope="session")
 def bruker_dat_file(example_data_dir):
     """Bruker .dat test file"""
     bruker_dir = os.path.join(example_data_dir, 'BigGABA_S1P_S01')
-    if os.path.exists(bruker_dir):
-        for file in os.listdir(bruker_dir):
-            if file.endswith('.dat'):
-                return os.path.join(bruker_dir, file)
-    return None
+    return next((f for f in get_files_for_format('.dat', example_data_dir)
+                 if os.path.dirname(f) == bruker_dir), None)
 
 
 @pytest.fixture(scope="session")
-def pulse_file(project_root_dir):
+def pulse_file():
     """Path to the pulse file for sLaser simulations"""
-    return os.path.join(project_root_dir, 'externals', 'jbss', 'my_pulse', 'standardized_goia.txt')
+    return str(PROJECT_ROOT / 'externals' / 'jbss' / 'my_pulse' / 'standardized_goia.txt')
 
 
 # Skip markers for missing dependencies
@@ -141,51 +234,47 @@ def pytest_configure(config):
         "markers", "requires_docker: mark test as requiring Docker"
     )
     config.addinivalue_line(
-        "markers", "requires_octave: mark test as requiring local Octave"
+        "markers", "requires_octave: mark test as requiring local Octave (binary and oct2py)"
     )
 
 
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add skip markers based on availability"""
-    # Check Docker availability (supports both Docker Desktop and OrbStack on macOS)
-    try:
-        import docker
-        # Try default connection first
-        try:
-            client = docker.from_env()
-            client.ping()
-            docker_available = True
-        except:
-            # On macOS with OrbStack, try OrbStack socket
-            import os
-            orbstack_socket = os.path.expanduser('~/.orbstack/run/docker.sock')
-            if os.path.exists(orbstack_socket):
-                try:
-                    client = docker.DockerClient(base_url=f'unix://{orbstack_socket}')
-                    client.ping()
-                    docker_available = True
-                except:
-                    docker_available = False
-            else:
-                docker_available = False
-    except:
-        docker_available = False
-
-    import shutil
-    octave_cmd = shutil.which('octave-cli') or shutil.which('octave')
-    # Local Octave is only usable when oct2py is also importable
-    if octave_cmd is not None:
-        try:
-            import oct2py  # noqa: F401
-            octave_available = True
-        except ImportError:
-            octave_available = False
-    else:
-        octave_available = False
+    # Only probe for what the collected tests actually need (unit-only runs skip both)
+    needs = {m for item in items for m in ('requires_docker', 'requires_octave')
+             if m in item.keywords}
+    if not needs:
+        return
+    docker_ok = 'requires_docker' not in needs or _probe_docker()
+    octave_ok = 'requires_octave' not in needs or _probe_octave()
 
     for item in items:
-        if "requires_docker" in item.keywords and not docker_available:
+        kw = item.keywords
+        if not docker_ok and "requires_docker" in kw:
             item.add_marker(pytest.mark.skip(reason="Docker not available"))
-        if "requires_octave" in item.keywords and not octave_available:
+        if not octave_ok and "requires_octave" in kw:
             item.add_marker(pytest.mark.skip(reason="Local Octave not available"))
 
+
+# REMY format sweeps (tests/remy/): collect per-file results and summarize once per format
+def pytest_sessionfinish(session):
+    """On an xdist worker, hand the sweep results over to the controller"""
+    config = session.config
+    if hasattr(config, 'workeroutput'):
+        config.workeroutput['remy_sweep'] = config.stash.get(REMY_RESULTS, {})
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge the sweep results of a finished xdist worker"""
+    results = getattr(node, 'workeroutput', {}).get('remy_sweep')
+    if results:
+        merge_results(node.config.stash.setdefault(REMY_RESULTS, {}), results)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Print the REMY field extraction statistics for every format that was swept"""
+    results = config.stash.get(REMY_RESULTS, {})
+    verbose = config.getoption('capture') == 'no'
+    for label in sorted(results):
+        print_summary(terminalreporter, label, results[label], verbose=verbose)
@@ -0,0 +1,140 @@
+"""
+Tests for core.octave_pool module
+"""
+
+import threading
+
+import pytest
+
+from basisremy.core.octave_pool import OctavePool, default_pool_size
+
+
+class FakeOctave:
+    """Stand-in session that records setup and shutdown."""
+
+    def __init__(self):
+        self.setup_calls = 0
+        self.exited = False
+        self.thread = threading.get_ident()
+
+    def exit(self):
+        self.exited = True
+
+
+@pytest.mark.core
+@pytest.mark.unit
+class TestOctavePool:
+    """Test OctavePool functionality"""
+
+    def test_default_pool_size_from_env(self, monkeypatch):
+        """Test worker count override via environment variable"""
+        monkeypatch.setenv('BASISREMY_OCTAVE_WORKERS', '3')
+        assert default_pool_size() == 3
+        monkeypatch.setenv('BASISREMY_OCTAVE_WORKERS', 'nonsense')
+        assert default_pool_size() >= 1
+
+    def test_imap_unordered_yields_fast_results_first(self):
+        """Test a slow task does not hold back the ones after it"""
+        release = threading.Event()
+
+        def work(octave, x):
+            if x == 0:
+                release.wait(5)
+            return x
+
+        pool = OctavePool(size=2, factory=FakeOctave)
+        try:
+            out = []
+            for x in pool.imap_unordered(work, range(4)):
+                out.append(x)
+                if len(out) == 3:
+                    release.set()
+        finally:
+            pool.close()
+        assert sorted(out) == [0, 1, 2, 3]
+        assert out[-1] == 0
+
+    def test_items_are_consumed_lazily(self):
+        """Test only a bounded number of tasks is queued ahead of the consumer"""
+        consumed = []
+
+        def items():
+            for x in range(100):
+                consumed.append(x)
+                yield x
+
+        pool = OctavePool(size=2, factory=FakeOctave)
+        try:
+            results = pool.imap_unordered(lambda octave, x: x, items())
+            next(results)
+            results.close()
+        finally:
+            pool.close()
+        assert len(consumed) <= 4 * pool.size
+
+    def test_sessions_are_reused_and_set_up_once(self):
+        """Test each worker creates at most one session and sets it up once"""
+        def setup(octave):
+            octave.setup_calls += 1
+
+        pool = OctavePool(size=2, setup=setup, factory=FakeOctave)
+        try:
+            first = list(pool.imap_unordered(lambda octave, _: octave, range(10)))
+            second = list(pool.imap_unordered(lambda octave, _: octave, range(10)))
+        finally:
+            pool.close()
+
+        sessions = {id(o): o for o in first + second}
+        assert 1 <= len(sessions) <= 2
+        assert all(o.setup_calls == 1 for o in sessions.values())
+        assert all(o.exited for o in sessions.values())
+
+    def test_dead_session_is_replaced(self):
+        """Test a worker drops a session that died and starts a new one"""
+        started = []
+
+        def factory():
+            started.append(FakeOctave())
+            return started[-1]
+
+        def work(octave, x):
+            if x == 0:
+                raise OSError('octave process died')
+            return octave
+
+        pool = OctavePool(size=1, factory=factory)
+        try:
+            with pytest.raises(OSError):
+                next(pool.imap_unordered(work, [0]))
+            assert started[0].exited
+            session = next(pool.imap_unordered(work, [1]))
+        finally:
+            pool.close()
+        assert len(started) == 2
+        assert session is started[1]
+
+    def test_failed_setup_closes_the_session(self):
+        """Test a session whose setup raises is shut down, not leaked"""
+        started = []
+
+        def factory():
+            started.append(FakeOctave())
+            return started[-1]
+
+        def setup(octave):
+            raise RuntimeError('addpath failed')
+
+        pool = OctavePool(size=1, setup=setup, factory=factory)
+        try:
+            with pytest.raises(RuntimeError):
+                next(pool.imap_unordered(lambda octave, x: x, [1]))
+        finally:
+            pool.close()
+        assert len(started) == 1 and started[0].exited
+
+    def test_closed_pool_rejects_work(self):
+        """Test a closed pool cannot be used again"""
+        pool = OctavePool(size=1, factory=FakeOctave)
+        pool.close()
+        with pytest.raises(RuntimeError):
+            list(pool.imap_unordered(lambda octave, x: x, [1]))
@@ -7,10 +7,10 @@ Provides dynamic file discovery based on:
 - Sequence type (from Excel metadata)
 """
 
+import functools
 import os
+import re
 import sys
-import pandas as pd
-from collections import defaultdict
 
 # Add project root to path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
@@ -22,75 +22,103 @@ if project_root not in sys.path:
 MRS_EXTENSIONS = {'.spar', '.7', '.dat', '.rda', '.ima', 'method', 'acqp', '.nii.gz', '.nii'}
 SKIP_EXTENSIONS = {'.xlsx', '.md', '.txt', '.png', '.jpg', '.pdf', '.pyc', '.DS_Store'}
 SKIP_FILES = {'T1.nii.gz'}
+# First Dataset_* component of a relative path (REMY_tests dataset folder)
+_DATASET_RE = re.compile(r'(?:^|{sep})(Dataset_[^{sep}]*)'.format(sep=re.escape(os.sep)))
 
-# Sequence detection patterns (centralized - easy to extend)
+# Directories never descended into (hidden directories are skipped as well)
+PRUNE_DIRS = {'.git', '__pycache__', 'venv', '.venv', 'node_modules', 'build', 'dist',
+              '.pytest_cache', '.mypy_cache'}
+
+# Sequence detection patterns (centralized - easy to extend): the keywords a
+# name must contain and the ones it must not, matched against the
+# (upper-cased) keywords found in the name, first match wins
 SEQUENCE_PATTERNS = {
-    'PRESS': lambda p: 'PRESS' in p and 'MEGA' not in p,
-    'STEAM': lambda p: 'STEAM' in p,
-    'sLASER': lambda p: 'SLASER' in p or 'OSLASER' in p,
-    'LASER': lambda p: 'LASER' in p and 'SLASER' not in p,
+    'PRESS': ({'PRESS'}, {'MEGA'}),
+    'STEAM': ({'STEAM'}, set()),
+    'sLASER': ({'SLASER'}, set()),
+    'LASER': ({'LASER'}, {'SLASER'}),
     # TODO: Add more sequences here as needed
-    # 'MEGA-PRESS': lambda p: 'MEGAPRESS' in p or 'MEGA-PRESS' in p,
-    # 'HERMES': lambda p: 'HERMES' in p,
-    # 'HERCULES': lambda p: 'HERCULES' in p,
+    # 'MEGA-PRESS': ({'MEGA', 'PRESS'}, set()),
+    # 'HERMES': ({'HERMES'}, set()),
+    # 'HERCULES': ({'HERCULES'}, set()),
 }
 
-
-def _detect_mrs_format(filename):
+# Every keyword of the table, found case-insensitively in one regex pass
+# (lookahead, so overlapping hits like SLASER/LASER are all reported; longest
+# first, with a keyword that starts another one implied by it)
+_KEYWORDS = sorted(set().union(*(required | excluded
+                                 for required, excluded in SEQUENCE_PATTERNS.values())),
+                   key=len, reverse=True)
+SEQUENCE_KEYWORDS = re.compile(r'(?=({}))'.format('|'.join(map(re.escape, _KEYWORDS))),
+                               re.IGNORECASE)
+_IMPLIED_KEYWORDS = {keyword: {other for other in _KEYWORDS if keyword.startswith(other)}
+                     for keyword in _KEYWORDS}
+
+def _detect_mrs_format(file_lower):
     """
-    Detect MRS file format from filename
+    Detect MRS file format from a lower-cased filename
 
     Returns:
         format_extension (str) or None
     """
-    file_lower = filename.lower()
-
-    # Check known extensions
-    if file_lower.endswith('.spar'):
-        return '.spar'
-    elif filename.endswith('.7'):
-        return '.7'
-    elif file_lower.endswith('.dat'):
-        return '.dat'
-    elif file_lower.endswith('.rda'):
-        return '.rda'
-    elif file_lower.endswith('.ima'):
-        return '.ima'
-    elif file_lower.endswith('method') or file_lower == 'method':
+    # Double extension first, then one set lookup on the last suffix
+    if file_lower.endswith('.nii.gz'):
+        return '.nii.gz'
+    _, dot, suffix = file_lower.rpartition('.')
+    if dot and dot + suffix in MRS_EXTENSIONS:
+        return dot + suffix
+
+    # Bruker parameter files (no extension)
+    if file_lower.endswith('method'):
         return 'method'
-    elif file_lower.endswith('acqp') or file_lower == 'acqp':
+    elif file_lower.endswith('acqp'):
         return 'acqp'
-    elif file_lower.endswith('.nii.gz'):
-        return '.nii.gz'
-    elif file_lower.endswith('.nii'):
-        return '.nii'
 
     return None
 
 
-def _detect_sequence_from_filename(filename):
+def _detect_sequence(text):
     """
-    Detect sequence from filename (for BigGABA and similar datasets)
+    Match a name (any case) against SEQUENCE_PATTERNS
+
+    Only the matched keywords are upper-cased, never the whole name.
 
     Returns:
         sequence_name or None
     """
-    filename_upper = filename.upper()
+    matches = SEQUENCE_KEYWORDS.findall(text)
+    if not matches:
+        return None
+    keywords = set().union(*(_IMPLIED_KEYWORDS[match.upper()] for match in set(matches)))
 
-    for sequence_name, pattern_func in SEQUENCE_PATTERNS.items():
-        if pattern_func(filename_upper):
+    for sequence_name, (required, excluded) in SEQUENCE_PATTERNS.items():
+        if required <= keywords and keywords.isdisjoint(excluded):
             return sequence_name
 
     return None
 
 
-def _build_folder_to_sequence_map(example_data_dir, sequence_map):
+@functools.lru_cache(maxsize=4096)
+def _detect_sequence_from_filename(filename):
+    """
+    Detect sequence from filename (for BigGABA and similar datasets)
+
+    Returns:
+        sequence_name or None
+    """
+    return _detect_sequence(filename)
+
+
+def _build_folder_to_sequence_map(example_data_dir, sequence_map=None):
     """
     Build mapping from actual folder names to sequences
 
     Handles the mapping between Excel dataset names (Dataset_B1, Dataset_G1)
     and actual folder names (Dataset_00_Bruker_14T_STEAM_08)
 
+    Without a sequence_map the Excel mapping is loaded on demand, i.e. only
+    if REMY_tests actually holds dataset folders.
+
     Returns:
         dict: {actual_folder_name: sequence}
     """
@@ -98,60 +126,91 @@ def _build_folder_to_sequence_map(example_data_dir, sequence_map):
     vendor_counters = {'B': 0, 'G': 0, 'P': 0, 'S': 0}
 
     remy_dir = os.path.join(example_data_dir, 'REMY_tests')
-    if not os.path.exists(remy_dir):
+    try:
+        with os.scandir(remy_dir) as entries:
+            folders = sorted(entry.name for entry in entries
+                             if entry.name.startswith('Dataset_')
+                             and entry.is_dir(follow_symlinks=False))
+    except (FileNotFoundError, NotADirectoryError):
+        return folder_to_sequence
+    if not folders:
         return folder_to_sequence
 
-    for folder in sorted(os.listdir(remy_dir)):
-        if folder.startswith('Dataset_'):
-            # Extract vendor from folder name
-            # Dataset_00_Bruker -> B, Dataset_02_GE -> G, etc.
-            parts = folder.split('_')
-            if len(parts) >= 3:
-                vendor_name = parts[2]
-                vendor_code = None
-
-                if vendor_name.startswith('Bruker'):
-                    vendor_code = 'B'
-                elif vendor_name.startswith('GE'):
-                    vendor_code = 'G'
-                elif vendor_name.startswith('Philips'):
-                    vendor_code = 'P'
-                elif vendor_name.startswith('Siemens'):
-                    vendor_code = 'S'
-
-                if vendor_code:
-                    vendor_counters[vendor_code] += 1
-                    mapped_name = f'Dataset_{vendor_code}{vendor_counters[vendor_code]}'
-
-                    # Look up sequence for this mapped name
-                    if mapped_name in sequence_map:
-                        folder_to_sequence[folder] = sequence_map[mapped_name]
+    if sequence_map is None:
+        sequence_map = load_sequence_mapping()
+
+    for folder in folders:
+        # Extract vendor from folder name
+        # Dataset_00_Bruker -> B, Dataset_02_GE -> G, etc.
+        parts = folder.split('_')
+        if len(parts) >= 3:
+            vendor_name = parts[2]
+            if vendor_name.startswith(('Bruker', 'GE', 'Philips', 'Siemens')):
+                vendor_code = vendor_name[0]
+                vendor_counters[vendor_code] += 1
+                mapped_name = f'Dataset_{vendor_code}{vendor_counters[vendor_code]}'
+
+                # Look up sequence for this mapped name
+                if mapped_name in sequence_map:
+                    folder_to_sequence[folder] = sequence_map[mapped_name]
 
     return folder_to_sequence
 
 
-def _get_sequence_for_file(filepath, example_data_dir, folder_to_sequence):
+def _relative_to(path, root):
+    """
+    path relative to root
+
+    The walker joins every path onto root, so cutting the prefix off is enough;
+    os.path.relpath (which normalizes both sides) is only the fallback.
+    """
+    if path == root:
+        return os.curdir
+    prefix = root if root.endswith(os.sep) else root + os.sep
+    if path.startswith(prefix):
+        return path[len(prefix):]
+    return os.path.relpath(path, root)
+
+
+def _get_sequence_for_folder(rel_dir, folder_to_sequence):
+    """
+    Sequence of the REMY_tests dataset folder a directory belongs to
+
+    Returns:
+        sequence_name or None
+    """
+    if 'REMY_tests' in rel_dir:
+        match = _DATASET_RE.search(rel_dir)
+        if match:
+            return folder_to_sequence.get(match.group(1))
+    return None
+
+
+def _get_sequence_for_file(filepath, example_data_dir, folder_to_sequence, folder_cache=None):
     """
     Determine sequence for a given file
 
+    All files of one folder share the folder part of the answer, so callers
+    classifying many files pass one dict as folder_cache to resolve it once
+    per directory.
+
     Returns:
         sequence_name or 'Unknown'
     """
-    rel_path = os.path.relpath(filepath, example_data_dir)
+    folder, filename = os.path.split(filepath)
+    if folder_cache is None:
+        folder_cache = {}
+    if folder not in folder_cache:
+        rel_dir = _relative_to(folder, example_data_dir)
+        folder_cache[folder] = (rel_dir, _get_sequence_for_folder(rel_dir, folder_to_sequence))
+    rel_dir, sequence = folder_cache[folder]
 
     # Check if in REMY_tests - use folder mapping
-    if 'REMY_tests' in rel_path:
-        parts = rel_path.split(os.sep)
-        for part in parts:
-            if part.startswith('Dataset_'):
-                sequence = folder_to_sequence.get(part)
-                if sequence:
-                    return sequence
-                break
+    if sequence:
+        return sequence
 
     # Check BigGABA - use filename
-    if 'BigGABA' in rel_path:
-        filename = os.path.basename(filepath)
+    if 'BigGABA' in rel_dir or 'BigGABA' in filename:
         sequence = _detect_sequence_from_filename(filename)
         if sequence:
             return sequence
@@ -169,41 +228,54 @@ def _detect_sequence_from_protocol(protocol):
     Returns:
         Sequence name or None
     """
-    protocol_upper = protocol.upper()
+    return _detect_sequence(protocol)
 
-    for sequence_name, pattern_func in SEQUENCE_PATTERNS.items():
-        if pattern_func(protocol_upper):
-            return sequence_name
 
-    return None
+def _mtime_ns(path):
+    """Modification time of path (None if missing), part of the discovery cache keys"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
 
 
 def load_sequence_mapping(excel_path='example_data/nbm70039-sup-0001-supplementary_material.xlsx'):
     """
     Load sequence mapping from Excel file using Protocol Description column
 
+    The parsed mapping is cached until the Excel file changes.
+
     Returns:
         dict: {dataset_folder_name: sequence_type}
     """
-    if not os.path.exists(excel_path):
+    return dict(_load_sequence_mapping(excel_path, _mtime_ns(excel_path)))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_sequence_mapping(excel_path, mtime_ns):
+    if mtime_ns is None:
         return {}
 
     try:
-        df = pd.read_excel(excel_path)
-
-        # First row is the header row
-        df.columns = df.iloc[0]
-        df = df[1:]  # Remove header row
+        # Only two columns are needed: read the raw rows instead of building a DataFrame
+        from openpyxl import load_workbook
+        wb = load_workbook(excel_path, read_only=True, data_only=True)
+        try:
+            # First row is the title row, second the header row
+            rows = list(wb.active.iter_rows(min_row=3, values_only=True))
+        finally:
+            wb.close()
 
         mapping = {}
         current_vendor = None
         dataset_counter = {}  # Track dataset numbers per vendor
 
-        for idx, row in df.iterrows():
-            dataset = str(row.iloc[0]).strip()
+        for row in rows:
+            # openpyxl hands back plain str/int/float/None cells
+            dataset = row[0].strip() if isinstance(row[0], str) else str(row[0])
 
             # Check if this is a vendor header row
-            if dataset in ['Bruker', 'GE', 'Philips', 'Siemens']:
+            if dataset in ('Bruker', 'GE', 'Philips', 'Siemens'):
                 current_vendor = dataset
                 if current_vendor not in dataset_counter:
                     dataset_counter[current_vendor] = 0
@@ -214,9 +286,10 @@ def load_sequence_mapping(excel_path='example_data/nbm70039-sup-0001-supplementa
                 continue
 
             # Get Protocol Description (column index 6)
-            protocol = str(row.iloc[6]).strip() if pd.notna(row.iloc[6]) else ''
+            protocol = row[6] if len(row) > 6 else None
+            protocol = protocol.strip() if isinstance(protocol, str) else ''
 
-            if not protocol or protocol == 'nan':
+            if not protocol:
                 continue
 
             # Create dataset folder name matching filesystem
@@ -243,10 +316,37 @@ def load_sequence_mapping(excel_path='example_data/nbm70039-sup-0001-supplementa
         return {}
 
 
+def _scan_files(root_dir):
+    """
+    Yield (filepath, filename) for every file below root_dir
+
+    Uses os.scandir so directory entries need no extra stat call. Hidden
+    directories and PRUNE_DIRS are skipped, symlinked directories are not
+    followed (same as os.walk).
+    """
+    stack = [root_dir]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not (entry.name.startswith('.') or entry.name in PRUNE_DIRS
+                            or entry.is_symlink()):
+                        stack.append(entry.path)
+                else:
+                    yield entry.path, entry.name
+
+
 def find_all_mrs_files(example_data_dir='example_data', group_by='format'):
     """
     Dynamically find ALL MRS data files in example_data
 
+    Results are cached per directory and grouping until the directory's
+    mtime changes; callers get fresh lists they are free to modify.
+
     Args:
         example_data_dir: Path to example_data directory
         group_by: How to group files - 'format' or 'sequence' or 'both'
@@ -256,75 +356,75 @@ def find_all_mrs_files(example_data_dir='example_data', group_by='format'):
         If group_by='sequence': {sequence_name: [filepaths]}
         If group_by='both': {(extension, sequence): [filepaths]}
     """
-    # Collect all MRS files
-    all_files = []
-    for root, dirs, filenames in os.walk(example_data_dir):
-        # Skip hidden directories and __pycache__
-        dirs[:] = [d for d in dirs if not d.startswith('.') and d != '__pycache__']
-
-        for file in filenames:
-            # Skip non-MRS files
-            if file.startswith('.'):
-                continue
-            if file in SKIP_FILES:
-                continue
-            if any(file.endswith(ext) for ext in SKIP_EXTENSIONS):
-                continue
-
-            # Detect format
-            detected_ext = _detect_mrs_format(file)
-            if detected_ext:
-                filepath = os.path.join(root, file)
-                all_files.append((filepath, detected_ext))
-
-    # Group by format only
-    if group_by == 'format':
-        files_by_format = defaultdict(list)
-        for filepath, ext in all_files:
-            files_by_format[ext].append(filepath)
+    grouped = _find_all_mrs_files(example_data_dir, os.path.abspath(example_data_dir), group_by,
+                                  _mtime_ns(example_data_dir))
+    return {key: list(files) for key, files in grouped.items()}
 
-        # Sort each list
-        for ext in files_by_format:
-            files_by_format[ext] = sorted(files_by_format[ext])
 
-        return dict(files_by_format)
-
-    # Group by sequence or both - need sequence mapping
-    sequence_map = load_sequence_mapping()
-    folder_to_sequence = _build_folder_to_sequence_map(example_data_dir, sequence_map)
+@functools.lru_cache(maxsize=8)
+def _index_mrs_files(example_data_dir, abs_dir, mtime_ns):
+    """
+    Walk example_data once: (filepath, format) for every MRS file, sorted by path
 
-    # Group by sequence only
-    if group_by == 'sequence':
-        files_by_sequence = defaultdict(list)
+    abs_dir and mtime_ns are only part of the cache key.
+    """
+    all_files = []
+    for filepath, file in _scan_files(example_data_dir):
+        # Skip non-MRS files
+        if file.startswith('.'):
+            continue
+        if file in SKIP_FILES:
+            continue
+        if os.path.splitext(file)[1] in SKIP_EXTENSIONS:
+            continue
+
+        # Detect format
+        detected_ext = _detect_mrs_format(file.lower())
+        if detected_ext:
+            all_files.append((filepath, detected_ext))
+
+    # Sorted once here, so every grouping below fills its buckets in order
+    all_files.sort()
+    return tuple(all_files)
+
+
+@functools.lru_cache(maxsize=8)
+def _index_mrs_sequences(example_data_dir, abs_dir, mtime_ns):
+    """
+    (filepath, format, sequence) for every MRS file, classified once
 
-        for filepath, ext in all_files:
-            sequence = _get_sequence_for_file(filepath, example_data_dir, folder_to_sequence)
-            files_by_sequence[sequence].append(filepath)
+    Kept separate from the walk so format-only lookups never load the Excel mapping
+    (and sequence lookups only do when there are REMY_tests dataset folders).
+    """
+    folder_to_sequence = _build_folder_to_sequence_map(example_data_dir)
+    folder_cache = {}
 
-        # Sort each list
-        for seq in files_by_sequence:
-            files_by_sequence[seq] = sorted(files_by_sequence[seq])
+    return tuple((filepath, ext, _get_sequence_for_file(filepath, example_data_dir,
+                                                        folder_to_sequence, folder_cache))
+                 for filepath, ext in _index_mrs_files(example_data_dir, abs_dir, mtime_ns))
 
-        return dict(files_by_sequence)
 
-    # Group by both format AND sequence
+@functools.lru_cache(maxsize=8)
+def _find_all_mrs_files(example_data_dir, abs_dir, group_by, mtime_ns):
+    # every grouping is a projection of the shared index
+    if group_by == 'format':
+        entries = ((ext, filepath)
+                   for filepath, ext in _index_mrs_files(example_data_dir, abs_dir, mtime_ns))
+    elif group_by == 'sequence':
+        entries = ((sequence, filepath)
+                   for filepath, ext, sequence in _index_mrs_sequences(example_data_dir, abs_dir, mtime_ns))
     elif group_by == 'both':
-        files_by_both = defaultdict(list)
-
-        for filepath, ext in all_files:
-            sequence = _get_sequence_for_file(filepath, example_data_dir, folder_to_sequence)
-            key = (ext, sequence)
-            files_by_both[key].append(filepath)
-
-        # Sort each list
-        for key in files_by_both:
-            files_by_both[key] = sorted(files_by_both[key])
-
-        return dict(files_by_both)
-
+        entries = (((ext, sequence), filepath)
+                   for filepath, ext, sequence in _index_mrs_sequences(example_data_dir, abs_dir, mtime_ns))
     else:
         raise ValueError(f"Invalid group_by: {group_by}. Must be 'format', 'sequence', or 'both'")
 
+    # the index is sorted by path, so every list already is too
+    grouped = {}
+    for key, filepath in entries:
+        grouped.setdefault(key, []).append(filepath)
+    return grouped
+
 
 def get_files_for_format(format_ext, example_data_dir='example_data'):
     """
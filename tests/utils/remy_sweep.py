@@ -0,0 +1,150 @@
+"""
+Shared per-file REMY sweep used by the format tests under tests/remy/
+
+Every format test is parametrized with one case per discovered file, so each
+file is reported on its own (and can be distributed by pytest-xdist). The
+per-file results are stashed on the pytest config and printed as one summary
+per format at the end of the session (see pytest_terminal_summary in
+tests/conftest.py).
+"""
+
+import os
+from collections import Counter
+
+import pytest
+
+from tests.utils.file_discovery import get_files_for_format
+
+
+_EMPTY = (None, '')
+
+# results per format label: {'successful': [[rel_path, fields]], 'failed': [[rel_path, error]]}
+REMY_RESULTS = pytest.StashKey[dict]()
+
+
+def _rel_path(filepath, prefix='example_data' + os.sep):
+    """Path relative to example_data (discovery returns paths under that prefix)"""
+    if filepath.startswith(prefix):
+        return filepath[len(prefix):]
+    return os.path.relpath(filepath, 'example_data')
+
+
+def sweep_cases(file_format):
+    """
+    One pytest.param per discovered file (id = path relative to example_data)
+
+    Returns a single skipped case when no files of the format are found.
+    """
+    files = get_files_for_format(file_format)
+    if not files:
+        return [pytest.param(None, marks=pytest.mark.skip(reason=f"No {file_format} files found"))]
+    return [pytest.param(f, id=_rel_path(f)) for f in files]
+
+
+def run_remy_sweep(config, label, filepath, basisremy):
+    """Run one file through REMY and record its extracted fields (or error)"""
+    results = config.stash.setdefault(REMY_RESULTS, {})
+    entry = results.setdefault(label, {'successful': [], 'failed': []})
+    rel_path = _rel_path(filepath)
+
+    try:
+        # Run through REMY
+        params = basisremy.runREMY(import_fpath=filepath)
+        if params is None:
+            params = {}
+
+        # Also get backend parsed params
+        try:
+            parsed_params, opt = basisremy.backend.parseREMY(params)
+            if parsed_params is None:
+                parsed_params = {}
+        except:
+            parsed_params = {}
+
+        # Collect ALL extracted fields, REMY values win over the backend-parsed ones
+        # (stringified, so xdist can ship them to the controller)
+        extracted_fields = {field: str(value)
+                            for source in (parsed_params, params)
+                            for field, value in source.items() if value not in _EMPTY}
+
+        entry['successful'].append([rel_path, extracted_fields])
+
+    except Exception as e:
+        # File threw an error
+        entry['failed'].append([rel_path, str(e)])
+
+
+def merge_results(into, results):
+    """Merge sweep results (e.g. from an xdist worker) into ``into``"""
+    for label, entry in results.items():
+        target = into.setdefault(label, {'successful': [], 'failed': []})
+        target['successful'].extend(entry['successful'])
+        target['failed'].extend(entry['failed'])
+
+
+def print_summary(tr, label, entry, verbose=False):
+    """Print the results / field statistics block for one format"""
+    successful_files = sorted(entry['successful'])
+    failed_files = sorted(entry['failed'])
+
+    field_counts = Counter()
+    for _, fields in successful_files:
+        field_counts.update(fields.keys())
+
+    # build the whole report first and hand it to the terminal in one write
+    lines = []
+    out = lines.append
+
+    total = len(successful_files) + len(failed_files)
+    success_count = len(successful_files)
+    fail_count = len(failed_files)
+
+    out(f"\n{'='*80}")
+    out(f"Testing {label} Format")
+    out(f"Found {total} files in example_data")
+    out(f"{'='*80}")
+
+    out(f"\n{'='*80}")
+    out(f"RESULTS: {label} Format")
+    out(f"{'='*80}")
+    out(f"Total files:   {total}")
+    out(f"Successful:    {success_count} ({success_count/total*100:.1f}%)")
+    out(f"Failed/Errors: {fail_count} ({fail_count/total*100:.1f}%)")
+
+    # Show files that threw errors (ALWAYS SHOWN)
+    if failed_files:
+        out(f"\n{'-'*80}")
+        out(f"FILES THAT THREW ERRORS ({len(failed_files)}):")
+        out(f"{'-'*80}")
+        for fpath, error in failed_files:
+            out(f"\n  {fpath}")
+            out(f"    ERROR: {error}")
+
+    # Show field extraction statistics - "Field: X/Y files (Z%)" (ALWAYS SHOWN)
+    if field_counts:
+        out(f"\n{'-'*80}")
+        out(f"FIELD EXTRACTION STATISTICS:")
+        out(f"{'-'*80}")
+        out(f"{'Field':<35s} | {'Extracted':>15s}")
+        out(f"{'-'*80}")
+
+        lines.extend(f"{field:<35s} | {count:>4d}/{total:<4d} ({count / total * 100:>5.1f}%)"
+                     for field, count in field_counts.most_common())
+
+    # Show detailed fields ONLY with -s flag (verbose mode)
+    if verbose and successful_files:
+        out(f"\n{'-'*80}")
+        out(f"DETAILED FIELD EXTRACTION (ALL {len(successful_files)} successful files):")
+        out(f"{'-'*80}")
+        for fpath, fields in successful_files:
+            out(f"\n{fpath}")
+            out(f"  Extracted {len(fields)} fields:")
+            for field, value in sorted(fields.items()):
+                value_str = value
+                if len(value_str) > 50:
+                    value_str = value_str[:47] + "..."
+                out(f"    {field:<30s}: {value_str}")
+
+    out(f"\n{'='*80}\n")
+
+    tr.write("\n".join(lines) + "\n")